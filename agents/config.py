@@ -394,6 +394,7 @@ class EnvironmentConfig:
         # Scraping settings
         self.headless_browser = os.getenv("HEADLESS_BROWSER", "true").lower() == "true"
         self.max_concurrent_requests = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
+        self.scout_use_bs4 = os.getenv("SCOUT_USE_BS4", "false").lower() == "true"
         
         # Logging
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
@@ -4,10 +4,14 @@ Ultra-reliable scraping system with self-healing capabilities
 """
 
 import asyncio
+import atexit
 import json
+import os
 import random
+import signal
 import time
-from typing import Dict, Any, List, Optional
+from collections import Counter, defaultdict, deque
+from typing import Dict, Any, List, Optional, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from bs4 import BeautifulSoup
 import aiohttp
@@ -15,20 +19,1205 @@ from loguru import logger
 import re
 from urllib.parse import urljoin, urlparse
 import hashlib
+from functools import lru_cache
 
 from google.adk.agents import Agent
 from config.models import ProductData, SiteConfig
 from config.modern_sites import MODERN_SITE_CONFIGS
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# Page heuristics (first h1, any price-looking text, ...) are guesses, so they stay out of
+# scraped products unless enabled; when enabled they only fill fields every other strategy left empty
+_USE_PAGE_HEURISTICS = os.getenv("SCRAPER_PAGE_HEURISTICS", "false").lower() == "true"
+
+
+# Chromium launch flags for the standalone (non-CDP) browser
+_CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=VizDisplayCompositor,VizHitTestSurfaceLayer',
+    '--disable-web-security',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+    '--disable-ipc-flooding-protection',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-component-update',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--no-pings',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-domain-reliability',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-datasaver-prompt',
+    '--disable-desktop-notifications',
+    '--disable-device-discovery-notifications',
+    '--allow-running-insecure-content',
+    '--disable-features=AudioServiceOutOfProcess',
+    '--disable-features=VizServiceBase',
+    '--window-size=1920,1080'
+]
+
+# Headers sent with every request of a scraper context
+_EXTRA_HTTP_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+    'sec-ch-ua': '"Not A(Brand";v="99", "Chromium";v="121", "Google Chrome";v="121"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"'
+}
+
+# aiohttp lets its own Accept-Encoding negotiation stand
+_STATIC_HTTP_HEADERS = {
+    name: value for name, value in _EXTRA_HTTP_HEADERS.items() if name != 'Accept-Encoding'
+}
+
+# ULTRA-STEALTH init script installed on every scraper context
+_STEALTH_INIT_SCRIPT = r"""
+// 🥷 ULTRA-STEALTH MODE - Remove ALL automation traces
+
+// 1. Remove webdriver property completely
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+    configurable: true
+});
+
+// 2. Mock realistic plugins array
+Object.defineProperty(navigator, 'plugins', {
+    get: () => {
+        return Object.setPrototypeOf([
+            {
+                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format", enabledPlugin: Plugin},
+                description: "Portable Document Format",
+                filename: "internal-pdf-viewer",
+                length: 1,
+                name: "Chrome PDF Plugin"
+            },
+            {
+                0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format", enabledPlugin: Plugin},
+                description: "Portable Document Format", 
+                filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+                length: 1,
+                name: "Chrome PDF Viewer"
+            }
+        ], PluginArray.prototype);
+    },
+    configurable: true
+});
+
+// 3. Mock languages naturally
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['tr-TR', 'tr', 'en-US', 'en'],
+    configurable: true
+});
+
+// 4. Mock hardware concurrency
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => 8,
+    configurable: true
+});
+
+// 5. Mock device memory
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => 8,
+    configurable: true
+});
+
+// 6. Mock connection
+Object.defineProperty(navigator, 'connection', {
+    get: () => ({
+        effectiveType: '4g',
+        rtt: 100,
+        downlink: 2.0
+    }),
+    configurable: true
+});
+
+// 7. Mock permissions query
+if (navigator.permissions && navigator.permissions.query) {
+    const originalQuery = navigator.permissions.query;
+    navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+}
+
+// 8. Mock chrome runtime with realistic properties
+if (!window.chrome) {
+    window.chrome = {
+        runtime: {
+            onConnect: undefined,
+            onMessage: undefined,
+            connect: function() { return { onDisconnect: {} }; }
+        },
+        app: {
+            isInstalled: false,
+            InstallState: {
+                DISABLED: 'disabled',
+                INSTALLED: 'installed',
+                NOT_INSTALLED: 'not_installed'
+            }
+        }
+    };
+}
+
+// 9. Override getParameter for WebGL fingerprinting
+const getParameter = WebGLRenderingContext.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel(R) Iris(TM) Graphics 6100';
+    }
+    return getParameter(parameter);
+};
+
+// 10. Mock screen properties
+Object.defineProperty(screen, 'colorDepth', {
+    get: () => 24,
+    configurable: true
+});
+
+Object.defineProperty(screen, 'pixelDepth', {
+    get: () => 24,
+    configurable: true
+});
+
+// 11. Human-like mouse and keyboard events
+let mouseX = Math.floor(Math.random() * window.innerWidth);
+let mouseY = Math.floor(Math.random() * window.innerHeight);
+
+// Simulate subtle mouse movements
+setInterval(() => {
+    mouseX += Math.floor(Math.random() * 3) - 1;
+    mouseY += Math.floor(Math.random() * 3) - 1;
+    
+    document.dispatchEvent(new MouseEvent('mousemove', {
+        clientX: mouseX,
+        clientY: mouseY,
+        bubbles: true
+    }));
+}, 100 + Math.random() * 100);
+
+// 12. Remove automation-controlled attribute
+delete navigator.__proto__.webdriver;
+
+// 13. Mock toString methods
+const originalToString = Function.prototype.toString;
+Function.prototype.toString = function() {
+    if (this === navigator.plugins) {
+        return 'function plugins() { [native code] }';
+    }
+    return originalToString.call(this);
+};
+
+// 14. Remove additional automation flags
+delete navigator.__webdriver_script_func;
+delete navigator.__webdriver_script_function;
+delete navigator.__selenium_unwrapped;
+delete navigator.__webdriver_unwrapped;
+delete navigator.__driver_evaluate;
+delete navigator.__webdriver_evaluate;
+delete navigator.__selenium_evaluate;
+delete navigator.__fxdriver_evaluate;
+delete navigator.__driver_unwrapped;
+delete navigator.__fxdriver_unwrapped;
+delete navigator.__webdriver_script_fn;
+
+// 15. Override chrome runtime
+window.chrome = {
+    runtime: {
+        onConnect: undefined,
+        onMessage: undefined
+    }
+};
+
+// 16. Mock battery API realistically
+if ('getBattery' in navigator) {
+    navigator.getBattery = () => Promise.resolve({
+        charging: Math.random() > 0.5,
+        chargingTime: Math.random() > 0.5 ? 0 : Infinity,
+        dischargingTime: Math.random() * 28800 + 3600, // 1-8 hours
+        level: Math.random() * 0.5 + 0.5 // 50-100%
+    });
+}
+
+// 17. Enhance screen properties
+Object.defineProperty(screen, 'availWidth', { get: () => 1920 });
+Object.defineProperty(screen, 'availHeight', { get: () => 1040 });
+
+// 18. Mock realistic connection
+Object.defineProperty(navigator, 'connection', {
+    get: () => ({
+        effectiveType: '4g',
+        downlink: Math.random() * 10 + 5, // 5-15 Mbps
+        rtt: Math.random() * 100 + 50 // 50-150ms
+    })
+});
+
+// 19. Intercept and modify requests to appear more natural
+const originalFetch = window.fetch;
+window.fetch = function(...args) {
+    if (args[1]) {
+        args[1].headers = {
+            ...args[1].headers,
+            'sec-ch-ua': '"Not A(Brand";v="99", "Chromium";v="121", "Google Chrome";v="121"',
+            'sec-ch-ua-mobile': '?0',
+            'sec-ch-ua-platform': '"Windows"'
+        };
+    }
+    return originalFetch.apply(this, args);
+};
+
+console.log('🥷 ULTRA-STEALTH activated - All automation traces removed');
+"""
+
+# Resource types aborted by the context route handler. Stylesheets stay allowed
+# because visibility-dependent reads (innerText, getBoundingClientRect) need layout.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+async def _abort_blocked_resources(route, request) -> None:
+    """Plain route handler for contexts without the stealth interception"""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Pages served by one browser context before it is closed and rebuilt
+_CONTEXT_PAGE_LIMIT = 100
+
+# Category paths discovered at once by discover_urls_advanced
+_DISCOVERY_CONCURRENCY = 4
+
+# Union selector for every meta tag _PAGE_EXTRACT_JS reads, resolved in one DOM pass
+_META_SELECTOR = (
+    'meta[property="og:title"], meta[property="og:description"], '
+    'meta[property="product:price:amount"], meta[name="description"]'
+)
+
+# JSON-LD @type values treated as a product node
+_PRODUCT_LD_TYPES = frozenset({'Product'})
+
+
+# Keys under which JSON-LD nests further nodes (Next.js/Shopify @graph, WebPage mainEntity)
+_LD_NESTED_KEYS = ('@graph', 'mainEntity')
+
+
+def _is_ld_product(node: Dict[str, Any]) -> bool:
+    """True when a JSON-LD node's @type (string or list) names a product"""
+    ld_type = node.get('@type')
+    if isinstance(ld_type, list):
+        return not _PRODUCT_LD_TYPES.isdisjoint(ld_type)
+    return ld_type in _PRODUCT_LD_TYPES
+
+
+def _find_ld_product(payload: Any) -> Optional[Dict[str, Any]]:
+    """Return the first Product node of a parsed JSON-LD payload, walking arrays and nested @graph blocks"""
+    # Explicit stack in document order; nested containers are visited where they appear
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            if _is_ld_product(node):
+                return node
+            for key in reversed(_LD_NESTED_KEYS):
+                if key in node:
+                    stack.append(node[key])
+    return None
+
+
+# Path markers followed by a product slug on Sephora/Rossmann
+_PRODUCT_PATH_MARKERS = ('/p/', '/product/')
+_SLUG_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
+
+
+def _has_slug_after(path: str, markers: tuple, min_length: int) -> bool:
+    """Check whether any marker in path is followed by at least min_length slug characters"""
+    for marker in markers:
+        start = path.find(marker)
+        while start >= 0:
+            slug_start = start + len(marker)
+            slug = path[slug_start:slug_start + min_length]
+            if len(slug) == min_length and _SLUG_CHARS.issuperset(slug):
+                return True
+            start = path.find(marker, start + 1)
+    return False
+
+
+# Path fragments rejected for every site before the site-specific check
+_INVALID_URL_EXTENSIONS = ('.js', '.css', '.png', '.jpg', '.gif', '.ico', '.xml', '.txt')
+_INVALID_URL_KEYWORDS = ('/api/', '/static/', '/assets/', '/login', '/register', '/logout')
+
+# Trendyol: -p-<5+ digits>, but never a category/campaign listing
+_TRENDYOL_PRODUCT_RE = re.compile(r'-p-\d{5,}')
+_TRENDYOL_EXCLUDED_PATHS = (
+    '/butik/', '/sr/', '/magaza/', '/hesabim/', '/sepetim/', '/kategori/', '/c-', '/kampanya',
+    'uygun-fiyatli', 'indirimli', '/x-c', '/kozmetik-x-c', '/cilt-bakimi-x-c', '/makyaj-x-c',
+    '/parfum-x-c', '/guzellik-x-c'
+)
+
+# Gratis: very broad acceptance, only obvious system URLs are excluded
+_GRATIS_EXCLUDED_PATHS = (
+    '/kategori/', '/marka/', '/hesap', '/sepet', '/giris', '/kayit',
+    '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg',
+    '/api/', '/static/', '/search?', '?', '/contact', '/about'
+)
+
+
+def _literal_alternation(fragments: tuple):
+    """Compile plain substrings into one regex so a path is scanned once, not once per fragment"""
+    return re.compile('|'.join(re.escape(fragment) for fragment in fragments))
+
+
+_INVALID_URL_PATH_RE = _literal_alternation(_INVALID_URL_EXTENSIONS + _INVALID_URL_KEYWORDS)
+_TRENDYOL_EXCLUDED_RE = _literal_alternation(_TRENDYOL_EXCLUDED_PATHS)
+_GRATIS_EXCLUDED_RE = _literal_alternation(_GRATIS_EXCLUDED_PATHS)
+
+
+def _is_trendyol_product_path(path: str) -> bool:
+    return bool(_TRENDYOL_PRODUCT_RE.search(path)) and not _TRENDYOL_EXCLUDED_RE.search(path)
+
+
+def _is_gratis_product_path(path: str) -> bool:
+    return not _GRATIS_EXCLUDED_RE.search(path)
+
+
+def _is_sephora_product_path(path: str) -> bool:
+    # /p/ or /product/ followed by at least 10 slug characters
+    return _has_slug_after(path, _PRODUCT_PATH_MARKERS, 10)
+
+
+def _is_rossmann_product_path(path: str) -> bool:
+    # /p/ or /product/ followed by at least 8 slug characters
+    return _has_slug_after(path, _PRODUCT_PATH_MARKERS, 8)
+
+
+# Lower-cased URL path -> is a product page, per site
+_PRODUCT_PATH_VALIDATORS = {
+    "trendyol": _is_trendyol_product_path,
+    "gratis": _is_gratis_product_path,
+    "sephora_tr": _is_sephora_product_path,
+    "rossmann": _is_rossmann_product_path,
+}
+
+
+@lru_cache(maxsize=64)
+def _url_origin(base_url: str) -> str:
+    """scheme://netloc of a base URL, the prefix a root-relative href resolves against"""
+    parsed = urlparse(base_url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _fast_join(base_url: str, href: str) -> str:
+    """urljoin with fast paths for absolute http(s) hrefs and plain root-relative paths"""
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+        return _url_origin(base_url) + href
+    # Protocol-relative, document-relative and dot-segment hrefs keep full RFC resolution
+    return urljoin(base_url, href)
+
+
+# Product page selectors per site, in priority order
+_PRODUCT_SELECTORS = {
+    "trendyol": {
+        "name": (
+            "h1.pr-new-br span", "h1", ".product-name", "[data-testid='product-name']",
+            ".product-title", "[class*='title']"
+        ),
+        "brand": (
+            "h1.pr-new-br a", ".product-brand", ".brand-name", "[data-testid='brand']",
+            ".brand", "a[class*='brand']"
+        ),
+        "price": (
+            ".prc-dsc", ".product-price", ".price", "[data-testid='price']",
+            ".current-price", "[class*='price']"
+        ),
+        "description": (
+            ".detail-desc-list", ".product-description", ".description",
+            "[data-testid='description']", ".product-detail"
+        ),
+        "images": (
+            "img.detail-img", ".product-images img", ".gallery img",
+            "[data-testid='product-image']"
+        )
+    },
+    "gratis": {
+        "name": (
+            "h1", ".product-name", ".product-title", "[data-testid='product-name']",
+            ".ems-prd-name"
+        ),
+        "brand": (
+            ".product-brand", ".brand-name", ".brand", ".ems-prd-brand"
+        ),
+        "price": (
+            ".product-price", ".price", "[class*='price']", ".ems-prd-price"
+        ),
+        "description": (
+            ".product-description", ".description", ".product-detail",
+            ".ems-prd-description"
+        ),
+        "images": (
+            ".product-image img", ".gallery img", "img[src*='gratis']"
+        )
+    }
+}
+
+# Universal selectors appended after the site-specific ones
+_UNIVERSAL_PRODUCT_SELECTORS = {
+    "name": ("h1", "[class*='title']", "[class*='name']", "[data-testid*='name']"),
+    "brand": (".brand", "[class*='brand']", "[data-testid*='brand']"),
+    "price": (".price", "[class*='price']", "[data-testid*='price']"),
+    "description": (".description", "[class*='desc']", "p", ".detail"),
+    "images": ("img", "[class*='image']", "[class*='photo']")
+}
+
+
+def _build_selector_spec(site_selectors: Dict[str, tuple]) -> tuple:
+    """Merge site selectors with the universal ones into a (field, selectors) tuple"""
+    merged = dict(site_selectors)
+    for field, field_selectors in _UNIVERSAL_PRODUCT_SELECTORS.items():
+        # Order-preserving dedupe: a selector shared by both lists is only queried once
+        merged[field] = tuple(dict.fromkeys(merged.get(field, ()) + field_selectors))
+    return tuple(merged.items())
+
+
+# Precomputed per-site extraction spec walked by _modern_selector_extraction
+_SELECTOR_SPEC = {
+    site_name: _build_selector_spec(site_selectors)
+    for site_name, site_selectors in _PRODUCT_SELECTORS.items()
+}
+_DEFAULT_SELECTOR_SPEC = _build_selector_spec({})
+
+# Product-link selector groups per site, tried in priority order by URL discovery
+_ADAPTIVE_SELECTORS = {
+    "trendyol": [
+        {
+            "name": "Primary Trendyol",
+            "product_link": "div.p-card-wrppr a[href*='/p-'], .product-item a[href*='/p-'], .prd-link a[href*='/p-']"
+        },
+        {
+            "name": "Modern Trendyol Cards", 
+            "product_link": ".p-card-chldrn-cntnr a, [data-id*='product'] a, .product-card a, [class*='product-'] a[href*='-p-'], a[href*='-p-']:not([href*='/c']):not([href*='/brand/']) "
+        },
+        {
+            "name": "Trendyol Product Links", 
+            "product_link": "a[href*='/p-']:not([href*='/c-']):not([href*='/category']):not([href*='/brand']), .product-container a[href*='/p-']"
+        },
+        {
+            "name": "Trendyol Universal", 
+            "product_link": "a[href*='trendyol.com/'][href*='-p-'], [class*='card'] a[href*='-p-'], [data-testid*='product'] a"
+        },
+        {
+            "name": "Trendyol Aggressive", 
+            "product_link": "a[href*='-p-']:not([href*='/c']):not([href*='butik']):not([href*='search']), a[href][title], a[href*='trendyol'][href*='-p-']"
+        },
+        {
+            "name": "Generic Trendyol",
+            "product_link": "a[href*='trendyol.com'][href*='-p-']:not([href*='/c-'])"
+        }
+    ],
+    "gratis": [
+        {
+            "name": "Primary Gratis Products",
+            "product_link": "a[href*='-p-']:not([href*='-b-']), a[href*='/p/'], a[href*='/urun/'], a[href*='/product/']"
+        },
+        {
+            "name": "Gratis Product Cards", 
+            "product_link": ".product-card a, .product-item a, [class*='product'] a, [data-testid*='product'] a"
+        },
+        {
+            "name": "Gratis Link Patterns",
+            "product_link": "a[href*='gratis.com'][href*='-p-'], a[href*='gratis.com'][href*='/p/']"
+        },
+        {
+            "name": "Generic Gratis Links",
+            "product_link": "a[href]:not([href*='javascript']):not([href*='mailto']):not([href*='tel'])"
+        }
+    ],
+    "sephora_tr": [
+        {
+            "name": "Primary Sephora",
+            "product_link": "a.product-item-link, .product-tile a, [data-comp='ProductTile'] a"
+        },
+        {
+            "name": "Alternative Sephora",
+            "product_link": "a[href*='/p/'], .product-container a"
+        }
+    ],
+    "rossmann": [
+        {
+            "name": "Primary Rossmann", 
+            "product_link": "a.product-item-link, .product-tile a, .product-card a"
+        },
+        {
+            "name": "Alternative Rossmann",
+            "product_link": "a[href*='/p/'], a[href*='/product/']"
+        }
+    ]
+}
+
+# Universal fallback groups appended after every site's own groups
+_UNIVERSAL_LINK_SELECTORS = [
+    {
+        "name": "Universal Product Links",
+        "product_link": "a[href*='/p/'], a[href*='/product/'], a[href*='/item/'], a[href*='-p-']"
+    },
+    {
+        "name": "Data Attribute Based",
+        "product_link": "[data-id] a, [data-product-id] a, [data-sku] a, [data-product] a"
+    },
+    {
+        "name": "Class Pattern Based", 
+        "product_link": ".product a, .item a, [class*='product'] a, [class*='item'] a"
+    }
+]
+
+# Site groups + universal fallback, joined once; callers only iterate these lists
+_ADAPTIVE_SELECTOR_GROUPS = {
+    site_name: groups + _UNIVERSAL_LINK_SELECTORS for site_name, groups in _ADAPTIVE_SELECTORS.items()
+}
+
+# In-page scan behind _ai_pattern_discovery: product-looking hrefs, product data
+# attributes or a product/item container ancestor
+_PRODUCT_LINKS_JS = r"""
+() => {
+    const links = [];
+    const allLinks = document.querySelectorAll('a[href]');
+    
+    // Pattern-based detection: /p/, /product/, /urun/, product ID, trailing number,
+    // detail and item pages folded into one alternation
+    const productPattern = /\/p\/|\/product\/|\/urun\/|-p-\d+|\/\d+$|detail|item/i;
+    
+    allLinks.forEach(link => {
+        const href = link.href;
+        const text = link.textContent.trim().toLowerCase();
+        
+        // Check URL patterns
+        const matchesPattern = productPattern.test(href);
+        
+        // Check if link has product-like attributes
+        const hasProductData = link.hasAttribute('data-id') || 
+                             link.hasAttribute('data-product-id') ||
+                             link.hasAttribute('data-sku');
+        
+        // Check parent elements for product containers
+        const parentElement = link.closest('[class*="product"], [class*="item"], [data-testid*="product"]');
+        
+        if (matchesPattern || hasProductData || parentElement) {
+            links.push(href);
+        }
+    });
+    
+    return [...new Set(links)];
+}
+"""
+
+# Server-side twin of _PRODUCT_LINKS_JS for selectolax
+_PRODUCT_LINK_HREF_RE = re.compile(r'/p/|/product/|/urun/|-p-\d+|/\d+$|detail|item', re.IGNORECASE)
+_PRODUCT_LINK_DATA_ATTRS = ('data-id', 'data-product-id', 'data-sku')
+
+
+def _in_product_container(node) -> bool:
+    """Mirror of link.closest('[class*="product"], [class*="item"], [data-testid*="product"]')"""
+    while node is not None:
+        attributes = node.attributes
+        css_class = attributes.get('class') or ''
+        if 'product' in css_class or 'item' in css_class or 'product' in (attributes.get('data-testid') or ''):
+            return True
+        node = node.parent
+    return False
+
+
+def _product_links_from_html(html: str, page_url: str) -> List[str]:
+    """Collect product-looking links from captured page HTML with selectolax"""
+    links = {}
+    for link in HTMLParser(html).css('a[href]'):
+        attributes = link.attributes
+        href = _fast_join(page_url, (attributes.get('href') or '').strip())
+        if (_PRODUCT_LINK_HREF_RE.search(href)
+                or any(attr in attributes for attr in _PRODUCT_LINK_DATA_ATTRS)
+                or _in_product_container(link)):
+            links[href] = None
+    return list(links)
+
+
+# Smooth scrollBy used by the human-behaviour helpers; offsets travel as the argument
+# so the same source string is sent (and compiled once by V8) on every call
+_SMOOTH_SCROLL_JS = "([left, top]) => window.scrollBy({top, left, behavior: 'smooth'})"
+
+# Response capture limits for _network_traffic_discovery: payloads kept per page
+# and the largest body (by content-length) that is parsed
+_JSON_RESPONSE_LIMIT = 50
+_JSON_RESPONSE_MAX_BYTES = 5 * 1024 * 1024
+
+@lru_cache(maxsize=8)
+def _unified_link_selector(site_name: str) -> str:
+    """All adaptive product-link selector groups for a site as one CSS union"""
+    groups = _ADAPTIVE_SELECTOR_GROUPS.get(site_name, _UNIVERSAL_LINK_SELECTORS)
+    return ', '.join(group['product_link'].strip() for group in groups)
+
+
+# JSON keys whose string values are checked as product URLs in API responses
+_JSON_URL_KEYS = frozenset({'url', 'link', 'href', 'slug', 'path'})
+
+# href attributes per selector group, one list (or null for an invalid selector) each;
+# with firstHit set, groups after the first one that yields links are not queried
+_LINK_HREFS_JS = r"""
+([selectors, firstHit]) => {
+    const result = [];
+    for (const selector of selectors) {
+        let hrefs = null;
+        try {
+            hrefs = [];
+            for (const el of document.querySelectorAll(selector)) {
+                const href = el.getAttribute('href');
+                if (href) hrefs.push(href);
+            }
+        } catch (e) {
+            hrefs = null;
+        }
+        result.push(hrefs);
+        if (firstHit && hrefs && hrefs.length) break;
+    }
+    return result;
+}
+"""
+
+# href attribute of every element matched by page.eval_on_selector_all
+_ELEMENT_HREFS_JS = "(elements) => elements.map((el) => el.getAttribute('href'))"
+
+# Per-link details read by _analyze_link_for_product_indicators, for every link at once
+_LINK_INFO_JS = r"""
+(links) => links.map((el) => ({
+    rawHref: el.getAttribute('href') || '',
+    href: el.href,
+    className: el.className,
+    id: el.id,
+    tagName: el.tagName,
+    parentClass: el.parentElement?.className || '',
+    grandParentClass: el.parentElement?.parentElement?.className || '',
+    text: el.textContent?.trim() || '',
+    hasImages: el.querySelector('img') ? true : false
+}))
+"""
+
+
+def _absolute_product_href(href: Optional[str], base_url: str) -> Optional[str]:
+    """Absolute URL for a raw href attribute; None for empty, fragment and javascript: links"""
+    if not href:
+        return None
+    if href.startswith('#') or href.startswith('javascript:'):
+        return None
+    if href.startswith('http'):
+        return href
+    return _fast_join(base_url, href)
+
+
+# Static-HTML twin of _LINK_HREFS_JS: hrefs per selector group, None for an invalid selector
+def _static_link_hrefs(html: str, selectors: List[str], first_hit: bool) -> List[Optional[List[str]]]:
+    """Resolve selector groups against fetched HTML (selectolax when installed, else BeautifulSoup)"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        select = lambda selector: [node.attributes.get('href') for node in tree.css(selector)]
+    else:
+        soup = BeautifulSoup(html, 'html.parser')
+        select = lambda selector: [element.get('href') for element in soup.select(selector)]
+    
+    result = []
+    for selector in selectors:
+        try:
+            hrefs = [href for href in select(selector) if href]
+        except Exception:
+            hrefs = None
+        result.append(hrefs)
+        if first_hit and hrefs:
+            break
+    return result
+
+
+# Links a static category fetch must yield before the Playwright navigation is skipped,
+# on sites whose static HTML has already proven complete
+_STATIC_MIN_LINKS = 3
+
+# Empty or invalid results after which a selector group is skipped for the rest of the run
+_SELECTOR_FAILURE_LIMIT = 3
+
+# Path markers and id patterns that mark a product URL, as one alternation
+_PRODUCT_URL_RE = re.compile(r'/p/|/product/|/urun/|/item/|/detail/|-p-\d+|/\d+(?:/|$)', re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def _config_domain(base_url: str) -> str:
+    """Bare host of a site config base URL, normalised once per site"""
+    return base_url.replace('https://', '').replace('http://', '').strip('/')
+
+
+# Price cleanup: currency words survive (group 1), any other non-price character is dropped
+_PRICE_CLEAN_RE = re.compile(r'(TL|USD|EUR)|[^\d,.\s₺$€]')
+
+
+def _trunc(value: Any, limit: int) -> str:
+    """Stripped text capped at limit characters; missing values become an empty string"""
+    if not value:
+        return ""
+    # JSON-LD can hand over numbers (e.g. offers.price)
+    value = (value if isinstance(value, str) else str(value)).strip()
+    return value if len(value) <= limit else value[:limit]
+
+
+# Generic price containers scanned after a site's own price selectors
+_PRICE_CANDIDATE_SELECTORS = (
+    '[class*="price" i]', '[class*="prc" i]', '[data-testid*="price" i]', '[itemprop="price"]',
+    'span', 'strong', 'b'
+)
+
+
+@lru_cache(maxsize=16)
+def _price_scan_selector(site_name: Optional[str]) -> str:
+    """Site price selectors plus generic price containers as one CSS union"""
+    site_price = dict(_SELECTOR_SPEC.get(site_name, _DEFAULT_SELECTOR_SPEC)).get('price', ())
+    return ', '.join(dict.fromkeys(site_price + _PRICE_CANDIDATE_SELECTORS))
+
+
+def _structured_from_ld(blocks: List[str]) -> Dict[str, Any]:
+    """Product fields from the first JSON-LD block holding a Product node"""
+    for raw in blocks:
+        if not raw:
+            continue
+        try:
+            payload = _json_loads(raw)
+        except ValueError:
+            continue
+        
+        product = _find_ld_product(payload)
+        if product is None:
+            continue
+        
+        structured_data = {}
+        if product.get('name'):
+            structured_data['name'] = product['name']
+        if product.get('description'):
+            structured_data['description'] = product['description']
+        offers = product.get('offers')
+        if isinstance(offers, dict) and offers.get('price'):
+            structured_data['price'] = offers['price']
+        brand = product.get('brand')
+        if brand:
+            structured_data['brand'] = brand.get('name') if isinstance(brand, dict) else brand
+        return structured_data
+    
+    return {}
+
+
+# Resolves a bare #id, .class or tag selector through the DOM's direct lookups and
+# anything else through querySelector; spliced into the injected functions below
+_FAST_QUERY_JS = r"""
+    const fastQuery = (sel) => {
+        if (/^#[\w-]+$/.test(sel)) return document.getElementById(sel.slice(1));
+        if (/^\.[\w-]+$/.test(sel)) return document.getElementsByClassName(sel.slice(1))[0] || null;
+        if (/^[a-zA-Z][\w-]*$/.test(sel)) return document.getElementsByTagName(sel)[0] || null;
+        return document.querySelector(sel);
+    };
+"""
+
+# Heuristic, JSON-LD and meta tag passes fused into one page.evaluate call.
+# Arg: [priceSelector, metaSelector, useHeuristics]; heuristics come back empty when disabled.
+# JSON-LD that can hold a Product ships as raw text and is parsed in Python by _structured_from_ld.
+_PAGE_EXTRACT_JS = r"""
+([priceSelector, metaSelector, useHeuristics]) => {""" + _FAST_QUERY_JS + r"""
+    // Blocks that never mention Product (Organization, BreadcrumbList, ...) are not shipped or parsed
+    const structured = Array.from(
+        document.querySelectorAll('script[type="application/ld+json"]'),
+        script => script.textContent
+    ).filter(text => text && text.indexOf('Product') !== -1);
+    
+    const meta = (() => {
+        const data = {};
+        const tags = {};
+        
+        // Single traversal over every meta tag of interest
+        for (const tag of document.querySelectorAll(metaSelector)) {
+            const key = tag.getAttribute('property') || tag.getAttribute('name');
+            if (!(key in tags)) {
+                tags[key] = tag.content;
+            }
+        }
+        
+        if (tags['og:title']) {
+            data.name = tags['og:title'];
+        }
+        const description = tags['og:description'] || tags['description'];
+        if (description) {
+            data.description = description;
+        }
+        if (tags['product:price:amount']) {
+            data.price = tags['product:price:amount'];
+        }
+        
+        return data;
+    })();
+    
+    // Heuristics only run when enabled and for fields the meta tags left empty, since meta outranks them
+    const ai = !useHeuristics ? {} : (() => {
+        const data = {};
+        
+        // Smart name detection
+        if (!meta.name) {
+            const nameSelectors = [
+                'h1', '[class*="title"]', '[class*="name"]',
+                '[data-testid*="name"]', '[data-testid*="title"]'
+            ];
+            for (const selector of nameSelectors) {
+                const element = fastQuery(selector);
+                if (element && element.textContent.trim().length > 5) {
+                    data.name = element.textContent.trim();
+                    break;
+                }
+            }
+        }
+        
+        // Smart price detection - only likely price containers, one joined query
+        if (!meta.price) {
+            const PRICE_RE = /[0-9]{1,}[.,]?[0-9]*\s*(₺|TL|EUR|USD|\$)/i;
+            let priceElements = [];
+            try {
+                priceElements = document.querySelectorAll(priceSelector);
+            } catch (e) {
+                priceElements = document.querySelectorAll('[class*="price" i], [itemprop="price"], span, strong, b');
+            }
+            // A miss on an element means no descendant can match (its text is a substring),
+            // so the subtree is skipped and each character is read at most once
+            let missed = null;
+            for (const element of priceElements) {
+                if (missed && missed.contains(element)) continue;
+                const priceMatch = PRICE_RE.exec(element.textContent || '');
+                if (priceMatch) {
+                    data.price = priceMatch[0];
+                    break;
+                }
+                missed = element;
+            }
+        }
+        
+        // Smart description detection - walk p/div/span lazily, stop on first hit
+        if (!meta.description) {
+            const DESC_RE = /ürün|product|özellik|kullanım|içerik/i;
+            const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT, {
+                acceptNode: n => {
+                    const t = n.tagName;
+                    return (t === 'P' || t === 'DIV' || t === 'SPAN') ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+                }
+            });
+            let element = walker.nextNode();
+            while (element) {
+                const raw = element.textContent || '';
+                if (raw.length > 10000) {
+                    // Page wrappers and footers can never fit the 1000-char limit; skip the trim copy but keep descending
+                    element = walker.nextNode();
+                    continue;
+                }
+                const text = raw.trim();
+                if (text.length <= 50) {
+                    // Descendant text is a substring of this text, so the whole subtree is too short
+                    element = walker.nextSibling();
+                    while (!element && walker.parentNode()) {
+                        element = walker.nextSibling();
+                    }
+                    continue;
+                }
+                // Length gate first; the keyword regex only runs on candidates of usable size
+                if (text.length < 1000 && DESC_RE.test(text)) {
+                    data.description = text;
+                    break;
+                }
+                element = walker.nextNode();
+            }
+        }
+        
+        return data;
+    })();
+    
+    return {ai, structured, meta};
+}
+"""
+
+
+# URL path keywords mapped to category labels
+_CATEGORY_KEYWORDS = (
+    ('makyaj', 'Makyaj'),
+    ('cilt-bakim', 'Cilt Bakımı'),
+    ('parfum', 'Parfüm'),
+    ('sac-bakim', 'Saç Bakımı'),
+)
+
+
+def _category_from_url(url: str) -> Optional[str]:
+    """Guess the product category from URL path keywords"""
+    url_lower = url.lower()
+    for keyword, category in _CATEGORY_KEYWORDS:
+        if keyword in url_lower:
+            return category
+    return None
+
+
+# Distinct trimmed innerText longer than minLength for every element matched by
+# any of the selectors, in selector order; invalid selectors (e.g. :contains) are skipped
+_SELECTOR_TEXTS_JS = r"""
+([selectors, minLength]) => {
+    const texts = [];
+    const seen = new Set();
+    for (const selector of selectors) {
+        let elements;
+        try {
+            elements = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const el of elements) {
+            const text = (el.innerText || '').trim();
+            if (text.length > minLength && !seen.has(text)) {
+                seen.add(text);
+                texts.push(text);
+            }
+        }
+    }
+    return texts;
+}
+"""
+
+
+# Fields extracted as lists and the number of values kept for each
+_LIST_FIELDS = frozenset({'ingredients', 'features', 'reviews', 'images'})
+_LIST_FIELD_LIMIT = 10
+
+
+def _build_selector_payload(spec: tuple, site_selectors: Dict[str, tuple]) -> List[list]:
+    """Convert a selector spec into the [field, joined, selectors, limit] rows read by _SELECTOR_EXTRACT_JS"""
+    # Only site-specific selectors are joined: in document order a universal one ('p', "[class*='price']")
+    # would match header, nav or banner elements before the product block
+    return [
+        [
+            field,
+            ', '.join(site_selectors.get(field, ())),
+            list(field_selectors),
+            _LIST_FIELD_LIMIT if field in _LIST_FIELDS else 0
+        ]
+        for field, field_selectors in spec
+    ]
+
+
+_SELECTOR_PAYLOAD = {
+    site_name: _build_selector_payload(spec, _PRODUCT_SELECTORS[site_name])
+    for site_name, spec in _SELECTOR_SPEC.items()
+}
+_DEFAULT_SELECTOR_PAYLOAD = _build_selector_payload(_DEFAULT_SELECTOR_SPEC, {})
+
+# Single fields try the joined site-specific selectors first (one DOM query, document order)
+# and only walk all selectors, universal ones last, in priority order when that match fails the field check;
+# list fields (limit > 0) keep up to `limit` non-empty values from the first selector that has any.
+# Returns {data, winners}; winners names the selector that filled a field in the ordered loop
+_SELECTOR_EXTRACT_JS = r"""
+(spec) => {""" + _FAST_QUERY_JS + r"""
+    const accept = (field, t) => field === 'price' ? /\d/.test(t) : t.length > 2;
+    const data = {};
+    const winners = {};
+    for (const [field, joined, selectors, limit] of spec) {
+        if (!limit && joined) {
+            try {
+                const el = document.querySelector(joined);
+                const t = el ? (el.textContent || '').trim() : '';
+                if (accept(field, t)) {
+                    data[field] = t;
+                    continue;
+                }
+            } catch (e) {
+                // One invalid selector breaks the joined list; per-selector loop below isolates it
+            }
+        }
+        for (const selector of selectors) {
+            try {
+                if (limit) {
+                    const values = [];
+                    for (const el of document.querySelectorAll(selector)) {
+                        if (values.length >= limit) break;
+                        if (field === 'images') {
+                            const src = el.getAttribute('src') || el.getAttribute('data-src');
+                            if (src && !src.startsWith('data:')) values.push(src);
+                        } else {
+                            const t = (el.textContent || '').trim();
+                            if (t) values.push(t);
+                        }
+                    }
+                    if (values.length) {
+                        data[field] = values;
+                        winners[field] = selector;
+                        break;
+                    }
+                } else {
+                    const el = fastQuery(selector);
+                    if (!el) continue;
+                    const t = (el.textContent || '').trim();
+                    if (accept(field, t)) {
+                        data[field] = t;
+                        winners[field] = selector;
+                        break;
+                    }
+                }
+            } catch (e) {
+                continue;
+            }
+        }
+    }
+    return {data, winners};
+}
+"""
+
+
+# Last-resort heuristics for one empty field; a single stable function that takes the
+# field name as its argument instead of new source formatted per field
+_FIELD_FALLBACK_JS = r"""
+(field) => {
+    // Alan bazlı akıllı extraction
+    if (field === 'category') {
+        const breadcrumb = document.querySelector('nav[aria-label="breadcrumb"], .breadcrumb, nav.breadcrumb');
+        if (breadcrumb) {
+            const links = breadcrumb.querySelectorAll('a');
+            if (links.length > 1) {
+                return links[1].textContent.trim();
+            }
+        }
+        // Alternative: look for category in page title or headings
+        const title = document.title;
+        if (title.includes('Makyaj')) return 'Makyaj';
+        if (title.includes('Cilt Bakım')) return 'Cilt Bakımı';
+        if (title.includes('Parfüm')) return 'Parfüm';
+        if (title.includes('Saç Bakım')) return 'Saç Bakımı';
+        return 'Kozmetik';
+    }
+
+    if (field === 'description') {
+        // Tüm p tag'lerini kontrol et
+        const paragraphs = document.querySelectorAll('p');
+        for (const p of paragraphs) {
+            const text = p.textContent.trim();
+            if (text.length > 100 && !text.includes('cookie') && !text.includes('gizlilik')) {
+                return text;
+            }
+        }
+
+        // Alternative: look for any meaningful text in divs
+        const divs = document.querySelectorAll('div');
+        for (const div of divs) {
+            const text = div.textContent.trim();
+            if (text.length > 50 && text.length < 1000 && 
+                (text.includes('ürün') || text.includes('kullanım') || text.includes('özellik'))) {
+                return text;
+            }
+        }
+    }
+
+    if (field === 'name') {
+        // Try multiple heading selectors
+        const headings = document.querySelectorAll('h1, h2, [class*="title"], [class*="name"]');
+        for (const heading of headings) {
+            const text = heading.textContent.trim();
+            if (text.length > 10 && text.length < 200) {
+                return text;
+            }
+        }
+    }
+
+    if (field === 'brand') {
+        // Look for brand in various places
+        const brandSelectors = ['[class*="brand"]', '[class*="marka"]', 'h1 a', '.manufacturer'];
+        for (const selector of brandSelectors) {
+            const element = document.querySelector(selector);
+            if (element) {
+                const text = element.textContent.trim();
+                if (text.length > 2 && text.length < 50) {
+                    return text;
+                }
+            }
+        }
+    }
+
+    if (field === 'price') {
+        // Look for price patterns
+        const priceElements = document.querySelectorAll('*');
+        for (const element of priceElements) {
+            const text = element.textContent.trim();
+            if (text.match(/\d+[.,]\d+.*₺/) || text.match(/₺.*\d+[.,]\d+/)) {
+                return text;
+            }
+        }
+    }
+
+    return '';
+}
+"""
+
 
 class ModernScraperAgent:
     """Ultra-modern scraper with AI-powered adaptation and self-healing"""
     
+    # One instance per worker; fixed attribute layout, no per-instance __dict__
+    __slots__ = (
+        '_playwright', 'browser', 'context', '_context_fingerprint', '_context_lock', '_retired_contexts',
+        '_pages_served', '_http', 'selector_cache', 'failure_patterns', '_winning_selectors',
+        '_static_complete_sites', 'proxy_list', 'user_agents'
+    )
+    
     def __init__(self):
+        self._playwright = None
         self.browser = None
         self.context = None
+        self._context_fingerprint = None
+        self._context_lock = None
+        self._retired_contexts = []
+        self._pages_served = 0
+        self._http = None
         self.selector_cache = {}
         self.failure_patterns = {}
+        # (site_name, field) -> how often each selector filled the field in the ordered fallback loop
+        self._winning_selectors: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        # Sites whose static category HTML held every link the browser found; only these skip Playwright
+        self._static_complete_sites = set()
         self.proxy_list = self._load_proxy_list()
         self.user_agents = self._load_user_agents()
         
@@ -56,81 +1245,64 @@ class ModernScraperAgent:
         """Initialize ultra-stealth browser with Playwright"""
         try:
             playwright = await async_playwright().start()
+            self._playwright = playwright
             
-            # Proxy varsa kullan
-            proxy_settings = None
-            if self.proxy_list:
-                proxy = random.choice(self.proxy_list)
-                proxy_settings = {"server": proxy}
-            
-            # Launch browser with ULTRA-STEALTH - Advanced anti-detection
-            self.browser = await playwright.chromium.launch(
-                headless=True,
-                proxy=proxy_settings,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=VizDisplayCompositor,VizHitTestSurfaceLayer',
-                    '--disable-web-security',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-default-apps',
-                    '--disable-extensions',
-                    '--disable-component-update',
-                    '--disable-background-networking',
-                    '--disable-sync',
-                    '--no-default-browser-check',
-                    '--mute-audio',
-                    '--no-pings',
-                    '--password-store=basic',
-                    '--use-mock-keychain',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--disable-domain-reliability',
-                    '--disable-component-extensions-with-background-pages',
-                    '--disable-breakpad',
-                    '--disable-client-side-phishing-detection',
-                    '--disable-datasaver-prompt',
-                    '--disable-desktop-notifications',
-                    '--disable-device-discovery-notifications',
-                    '--allow-running-insecure-content',
-                    '--disable-features=AudioServiceOutOfProcess',
-                    '--disable-features=VizServiceBase',
-                    '--window-size=1920,1080'
-                ]
-            )
+            cdp_url = os.getenv("PLAYWRIGHT_CDP_URL")
+            if cdp_url:
+                # Shared Chromium: replicas only add their own isolated context on top
+                self.browser = await playwright.chromium.connect_over_cdp(cdp_url)
+                logger.info(f"Connected to shared browser at {cdp_url}")
+            else:
+                # Proxy varsa kullan
+                proxy_settings = None
+                if self.proxy_list:
+                    proxy = random.choice(self.proxy_list)
+                    proxy_settings = {"server": proxy}
+            
+                # Launch browser with ULTRA-STEALTH - Advanced anti-detection
+                self.browser = await playwright.chromium.launch(
+                    headless=True,
+                    proxy=proxy_settings,
+                    args=_CHROMIUM_ARGS
+                )
         
-            # Create ultra-stealth context with realistic session persistence
-            self.context = await self.browser.new_context(
-                viewport={'width': random.choice([1920, 1366, 1536]), 'height': random.choice([1080, 768, 864])},
-                user_agent=random.choice(self.user_agents),
-                locale='tr-TR',
-                timezone_id='Europe/Istanbul',
-                ignore_https_errors=True,  # Ignore SSL certificate errors
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Cache-Control': 'max-age=0',
-                    'sec-ch-ua': f'"Not A(Brand";v="99", "Chromium";v="121", "Google Chrome";v="121"',
-                    'sec-ch-ua-mobile': '?0',
-                    'sec-ch-ua-platform': '"Windows"'
-                }
+            # Created inside the running loop (asyncio.Lock binds to it on Python 3.9)
+            self._context_lock = asyncio.Lock()
+            self.context = await self._build_context()
+            
+            # Pooled HTTP session for server-rendered listings, sharing the context fingerprint
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=4),
+                headers={**_STATIC_HTTP_HEADERS, 'User-Agent': self._context_fingerprint['user_agent']},
+                timeout=aiohttp.ClientTimeout(total=20)
             )
             
-            # Add realistic cookies to simulate returning user
-            await self.context.add_cookies([
+        except Exception as e:
+            logger.error(f"Browser initialization failed: {e}")
+            raise e
+    
+    async def _build_context(self, storage_state: Optional[Dict[str, Any]] = None) -> BrowserContext:
+        """Create an ultra-stealth browser context, optionally restoring a previous storage state"""
+        # Fingerprint is drawn once so a recycled context looks like the same visitor
+        if self._context_fingerprint is None:
+            self._context_fingerprint = {
+                'viewport': {'width': random.choice([1920, 1366, 1536]), 'height': random.choice([1080, 768, 864])},
+                'user_agent': random.choice(self.user_agents)
+            }
+        
+        # Create ultra-stealth context with realistic session persistence
+        context = await self.browser.new_context(
+            **self._context_fingerprint,
+            storage_state=storage_state,
+            locale='tr-TR',
+            timezone_id='Europe/Istanbul',
+            ignore_https_errors=True,  # Ignore SSL certificate errors
+            extra_http_headers=_EXTRA_HTTP_HEADERS
+        )
+        
+        # Add realistic cookies to simulate returning user (carried by storage_state on recycle)
+        if storage_state is None:
+            await context.add_cookies([
                 {
                     'name': 'sessionId',
                     'value': f'sess_{random.randint(100000000, 999999999)}',
@@ -145,217 +1317,40 @@ class ModernScraperAgent:
                 }
             ])
         
-            # Add ULTRA-STEALTH scripts - Advanced anti-detection
-            await self.context.add_init_script("""
-            // 🥷 ULTRA-STEALTH MODE - Remove ALL automation traces
-            
-            // 1. Remove webdriver property completely
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined,
-                configurable: true
-            });
-            
-            // 2. Mock realistic plugins array
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => {
-                    return Object.setPrototypeOf([
-                        {
-                            0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format", enabledPlugin: Plugin},
-                            description: "Portable Document Format",
-                            filename: "internal-pdf-viewer",
-                            length: 1,
-                            name: "Chrome PDF Plugin"
-                        },
-                        {
-                            0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format", enabledPlugin: Plugin},
-                            description: "Portable Document Format", 
-                            filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                            length: 1,
-                            name: "Chrome PDF Viewer"
-                        }
-                    ], PluginArray.prototype);
-                },
-                configurable: true
-            });
-            
-            // 3. Mock languages naturally
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['tr-TR', 'tr', 'en-US', 'en'],
-                configurable: true
-            });
-            
-            // 4. Mock hardware concurrency
-            Object.defineProperty(navigator, 'hardwareConcurrency', {
-                get: () => 8,
-                configurable: true
-            });
-            
-            // 5. Mock device memory
-            Object.defineProperty(navigator, 'deviceMemory', {
-                get: () => 8,
-                configurable: true
-            });
-            
-            // 6. Mock connection
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '4g',
-                    rtt: 100,
-                    downlink: 2.0
-                }),
-                configurable: true
-            });
-            
-            // 7. Mock permissions query
-            if (navigator.permissions && navigator.permissions.query) {
-                const originalQuery = navigator.permissions.query;
-                navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            }
-            
-            // 8. Mock chrome runtime with realistic properties
-            if (!window.chrome) {
-                window.chrome = {
-                    runtime: {
-                        onConnect: undefined,
-                        onMessage: undefined,
-                        connect: function() { return { onDisconnect: {} }; }
-                    },
-                    app: {
-                        isInstalled: false,
-                        InstallState: {
-                            DISABLED: 'disabled',
-                            INSTALLED: 'installed',
-                            NOT_INSTALLED: 'not_installed'
-                        }
-                    }
-                };
-            }
-            
-            // 9. Override getParameter for WebGL fingerprinting
-            const getParameter = WebGLRenderingContext.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                if (parameter === 37445) {
-                    return 'Intel Inc.';
-                }
-                if (parameter === 37446) {
-                    return 'Intel(R) Iris(TM) Graphics 6100';
-                }
-                return getParameter(parameter);
-            };
-            
-            // 10. Mock screen properties
-            Object.defineProperty(screen, 'colorDepth', {
-                get: () => 24,
-                configurable: true
-            });
-            
-            Object.defineProperty(screen, 'pixelDepth', {
-                get: () => 24,
-                configurable: true
-            });
-            
-            // 11. Human-like mouse and keyboard events
-            let mouseX = Math.floor(Math.random() * window.innerWidth);
-            let mouseY = Math.floor(Math.random() * window.innerHeight);
-            
-            // Simulate subtle mouse movements
-            setInterval(() => {
-                mouseX += Math.floor(Math.random() * 3) - 1;
-                mouseY += Math.floor(Math.random() * 3) - 1;
-                
-                document.dispatchEvent(new MouseEvent('mousemove', {
-                    clientX: mouseX,
-                    clientY: mouseY,
-                    bubbles: true
-                }));
-            }, 100 + Math.random() * 100);
-            
-            // 12. Remove automation-controlled attribute
-            delete navigator.__proto__.webdriver;
-            
-            // 13. Mock toString methods
-            const originalToString = Function.prototype.toString;
-            Function.prototype.toString = function() {
-                if (this === navigator.plugins) {
-                    return 'function plugins() { [native code] }';
-                }
-                return originalToString.call(this);
-            };
-            
-            // 14. Remove additional automation flags
-            delete navigator.__webdriver_script_func;
-            delete navigator.__webdriver_script_function;
-            delete navigator.__selenium_unwrapped;
-            delete navigator.__webdriver_unwrapped;
-            delete navigator.__driver_evaluate;
-            delete navigator.__webdriver_evaluate;
-            delete navigator.__selenium_evaluate;
-            delete navigator.__fxdriver_evaluate;
-            delete navigator.__driver_unwrapped;
-            delete navigator.__fxdriver_unwrapped;
-            delete navigator.__webdriver_script_fn;
-            
-            // 15. Override chrome runtime
-            window.chrome = {
-                runtime: {
-                    onConnect: undefined,
-                    onMessage: undefined
-                }
-            };
-            
-            // 16. Mock battery API realistically
-            if ('getBattery' in navigator) {
-                navigator.getBattery = () => Promise.resolve({
-                    charging: Math.random() > 0.5,
-                    chargingTime: Math.random() > 0.5 ? 0 : Infinity,
-                    dischargingTime: Math.random() * 28800 + 3600, // 1-8 hours
-                    level: Math.random() * 0.5 + 0.5 // 50-100%
-                });
-            }
-            
-            // 17. Enhance screen properties
-            Object.defineProperty(screen, 'availWidth', { get: () => 1920 });
-            Object.defineProperty(screen, 'availHeight', { get: () => 1040 });
-            
-            // 18. Mock realistic connection
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '4g',
-                    downlink: Math.random() * 10 + 5, // 5-15 Mbps
-                    rtt: Math.random() * 100 + 50 // 50-150ms
-                })
-            });
-            
-            // 19. Intercept and modify requests to appear more natural
-            const originalFetch = window.fetch;
-            window.fetch = function(...args) {
-                if (args[1]) {
-                    args[1].headers = {
-                        ...args[1].headers,
-                        'sec-ch-ua': '"Not A(Brand";v="99", "Chromium";v="121", "Google Chrome";v="121"',
-                        'sec-ch-ua-mobile': '?0',
-                        'sec-ch-ua-platform': '"Windows"'
-                    };
-                }
-                return originalFetch.apply(this, args);
-            };
-            
-            console.log('🥷 ULTRA-STEALTH activated - All automation traces removed');
-            """)
-            
-            # Add realistic request interception for better stealth
-            await self.context.route("**/*", self._intercept_requests)
-            
-        except Exception as e:
-            logger.error(f"Browser initialization failed: {e}")
-            raise e
+        # Add ULTRA-STEALTH scripts - Advanced anti-detection
+        await context.add_init_script(_STEALTH_INIT_SCRIPT)
+        
+        # Add realistic request interception for better stealth
+        await context.route("**/*", self._intercept_requests)
+        
+        return context
+    
+    async def _new_page(self) -> Page:
+        """Open a page, recycling the browser context every _CONTEXT_PAGE_LIMIT pages"""
+        async with self._context_lock:
+            # Close contexts retired earlier once their last page is gone
+            for retired in [c for c in self._retired_contexts if not c.pages]:
+                self._retired_contexts.remove(retired)
+                await retired.close()
+            
+            if self._pages_served >= _CONTEXT_PAGE_LIMIT:
+                # Playwright frees Request/Response objects only on context close
+                state = await self.context.storage_state()
+                self._retired_contexts.append(self.context)
+                self.context = await self._build_context(storage_state=state)
+                self._pages_served = 0
+                logger.debug("Browser context recycled after {} pages", _CONTEXT_PAGE_LIMIT)
+            
+            self._pages_served += 1
+            return await self.context.new_page()
     
     async def _intercept_requests(self, route, request):
         """Intercept and modify requests to appear more natural"""
+        # Nothing downstream reads image, font or media bytes - never download them
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+        
         try:
             # Add natural request timing
             await asyncio.sleep(random.uniform(0.01, 0.05))
@@ -389,58 +1384,37 @@ class ModernScraperAgent:
         relevant_paths = self._select_category_paths(site_config, target_category)
         logger.info(f"📍 Selected {len(relevant_paths)} relevant category paths for '{target_category}'")
         
-        discovered_urls = []
+        # Category paths are independent page loads on the shared context - overlap them
+        semaphore = asyncio.Semaphore(_DISCOVERY_CONCURRENCY)
         
-        # Try ONLY relevant category paths for efficiency
-        for category_path in relevant_paths:
-            logger.info(f"Processing category path: {category_path}")
-            full_url = urljoin(str(site_config.base_url), category_path)
-            logger.info(f"Full URL: {full_url}")
-            
-            try:
-                # Strategy 1: Universal intelligent discovery
-                urls = await self._universal_url_discovery(site_config, category_path)
-                discovered_urls.extend(urls)
-                logger.info(f"Universal discovery found {len(urls)} URLs for {category_path}")
-                
-                # Debug: Log sample URLs from classical discovery
-                for i, url in enumerate(urls[:3]):
-                    logger.info(f"  Classical URL {i+1}: {url}")
-                
-                # Strategy 2: AI-powered pattern recognition for each category
-                ai_urls = await self._ai_pattern_discovery(site_config, category_path)
-                discovered_urls.extend(ai_urls)
-                logger.info(f"AI pattern discovery found {len(ai_urls)} URLs for {category_path}")
-                
-                # Debug: Log sample URLs from AI discovery
-                for i, url in enumerate(ai_urls[:3]):
-                    logger.info(f"  AI URL {i+1}: {url}")
-                
-                # Stop if we have enough URLs
-                if len(discovered_urls) >= max_products:
-                    logger.info(f"Found enough URLs: {len(discovered_urls)}")
-                    break
-                    
-            except Exception as e:
-                logger.error(f"URL discovery failed for {category_path}: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+        async def discover(category_path: str) -> List[str]:
+            async with semaphore:
+                return await self._discover_one(site_config, category_path)
+        
+        results = await asyncio.gather(
+            *(discover(category_path) for category_path in relevant_paths),
+            return_exceptions=True
+        )
+        
+        # Merge per-path results, dropping duplicates as they arrive
+        seen = set()
+        unique_urls = []
+        for category_path, result in zip(relevant_paths, results):
+            if isinstance(result, BaseException):
+                logger.error(f"URL discovery failed for {category_path}: {result}")
                 continue
+            for url in result:
+                if url not in seen:
+                    seen.add(url)
+                    unique_urls.append(url)
         
-        # Remove duplicates and validate
-        unique_urls = list(dict.fromkeys(discovered_urls))
         logger.info(f"Found {len(unique_urls)} unique URLs before validation")
         
         # Debug: Log some sample URLs
         for i, url in enumerate(unique_urls[:5]):
             logger.info(f"Sample URL {i+1}: {url}")
         
-        validated_urls = []
-        for url in unique_urls:
-            if self._is_valid_product_url(url, site_config):
-                validated_urls.append(url)
-            else:
-                logger.debug(f"URL rejected: {url}")
+        validated_urls = self._filter_valid_product_urls(unique_urls, site_config)
         
         logger.info(f"Validated {len(validated_urls)} URLs after filtering")
         
@@ -473,6 +1447,29 @@ class ModernScraperAgent:
         
         return validated_urls[:max_products]
     
+    async def _discover_one(self, site_config: SiteConfig, category_path: str) -> List[str]:
+        """Run universal and AI pattern discovery for a single category path"""
+        logger.info(f"Processing category path: {category_path}")
+        logger.info(f"Full URL: {urljoin(str(site_config.base_url), category_path)}")
+        
+        # Strategy 1: Universal intelligent discovery
+        urls = await self._universal_url_discovery(site_config, category_path)
+        logger.info(f"Universal discovery found {len(urls)} URLs for {category_path}")
+        
+        # Debug: Log sample URLs from classical discovery
+        for i, url in enumerate(urls[:3]):
+            logger.info(f"  Classical URL {i+1}: {url}")
+        
+        # Strategy 2: AI-powered pattern recognition for each category
+        ai_urls = await self._ai_pattern_discovery(site_config, category_path)
+        logger.info(f"AI pattern discovery found {len(ai_urls)} URLs for {category_path}")
+        
+        # Debug: Log sample URLs from AI discovery
+        for i, url in enumerate(ai_urls[:3]):
+            logger.info(f"  AI URL {i+1}: {url}")
+        
+        return urls + ai_urls
+    
     def _select_category_paths(self, site_config: SiteConfig, target_category: str) -> List[str]:
         """Intelligently select most relevant category paths based on target category"""
         if not target_category:
@@ -656,6 +1653,8 @@ class ModernScraperAgent:
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True, args=['--no-sandbox', '--disable-dev-shm-usage'])
             context = await browser.new_context(user_agent=random.choice(self.user_agents))
+            # Only text is read from these pages
+            await context.route("**/*", _abort_blocked_resources)
             
             for i, url in enumerate(sample_urls):
                 try:
@@ -819,16 +1818,72 @@ class ModernScraperAgent:
             validated_urls.extend(remaining_urls[:10])
             logger.info(f"Added {len(remaining_urls[:10])} remaining URLs without validation")
         
-        logger.info(f"Category content validation: {len(urls)} → {len(validated_urls)} URLs")
-        return validated_urls
+        logger.info(f"Category content validation: {len(urls)} → {len(validated_urls)} URLs")
+        return validated_urls
+    
+    async def _try_static_discovery(
+        self, config: SiteConfig, category_path: str
+    ) -> Tuple[List[str], List[Tuple[Dict[str, str], Optional[List[str]]]]]:
+        """Fetch a category page over plain HTTP and apply the adaptive selectors to its HTML
+        
+        Returns the product URLs and each tried selector group with its hrefs (None when invalid).
+        """
+        if self._http is None:
+            return [], []
+        
+        base_url = str(config.base_url)
+        full_url = urljoin(base_url, category_path)
+        try:
+            async with self._http.get(full_url) as response:
+                if response.status != 200:
+                    return [], []
+                html = await response.text()
+        except Exception as e:
+            logger.debug("Static fetch failed for {}: {}", full_url, e)
+            return [], []
+        
+        selectors = self._ranked_selector_groups(config.name)
+        group_hrefs = _static_link_hrefs(
+            html, [group['product_link'] for group in selectors], config.name != "gratis"
+        )
+        
+        urls = []
+        seen = set()
+        for hrefs in group_hrefs:
+            for href in hrefs or ():
+                full_product_url = _fast_join(base_url, href)
+                if full_product_url not in seen:
+                    seen.add(full_product_url)
+                    urls.append(full_product_url)
+        return urls, list(zip(selectors, group_hrefs))
+    
+    def _record_selector_outcome(self, site_name: str, selector_group: Dict[str, str], hrefs: Optional[List[str]]) -> None:
+        """Count an empty or invalid result against a selector group, or clear its failures and rank it first"""
+        failure_key = (site_name, selector_group['name'])
+        if hrefs:
+            self.failure_patterns.pop(failure_key, None)
+            self.selector_cache.setdefault(site_name, selector_group['name'])
+        else:
+            self.failure_patterns[failure_key] = self.failure_patterns.get(failure_key, 0) + 1
     
     async def _classical_url_discovery(self, config: SiteConfig, category_path: str) -> List[str]:
         """Enhanced classical scraping with adaptive selectors"""
-        page = await self.context.new_page()
+        # Server-rendered listings need no browser; navigate unless the site's static HTML has
+        # already proven complete and this page yields enough links
+        static_urls, static_outcomes = await self._try_static_discovery(config, category_path)
+        if len(static_urls) >= _STATIC_MIN_LINKS and config.name in self._static_complete_sites:
+            for selector_group, hrefs in static_outcomes:
+                self._record_selector_outcome(config.name, selector_group, hrefs)
+            logger.info(f"Static discovery found {len(static_urls)} URLs for {category_path}")
+            return static_urls
+        
+        page = await self._new_page()
         urls = []
+        seen = set()  # duplicates are dropped as they are found, keeping first-seen order
+        base_url = str(config.base_url)
         
         try:
-            full_url = urljoin(str(config.base_url), category_path)
+            full_url = urljoin(base_url, category_path)
             logger.info(f"Navigating to: {full_url}")
             
             # Navigate with human-like behavior
@@ -843,26 +1898,34 @@ class ModernScraperAgent:
             logger.info(f"Page loaded, title: {page_title}")
             
             # Try multiple selector strategies
-            selectors = self._get_adaptive_selectors(config.name)
+            selectors = self._ranked_selector_groups(config.name)
             logger.info(f"Testing {len(selectors)} selector strategies for {config.name}")
             
-            for i, selector_group in enumerate(selectors):
+            # Every selector group is resolved in a single page round-trip
+            group_hrefs = await page.evaluate(
+                _LINK_HREFS_JS,
+                [[group['product_link'] for group in selectors], config.name != "gratis"]
+            )
+            
+            for i, (selector_group, hrefs) in enumerate(zip(selectors, group_hrefs)):
                 try:
                     selector = selector_group['product_link']
                     logger.info(f"Testing selector {i+1}: {selector_group['name']} - {selector}")
                     
-                    elements = await page.query_selector_all(selector)
-                    logger.info(f"  Found {len(elements)} elements with this selector")
+                    self._record_selector_outcome(config.name, selector_group, hrefs)
+                    if hrefs is None:
+                        raise ValueError(f"invalid selector: {selector}")
+                    logger.info(f"  Found {len(hrefs)} links with this selector")
                     
-                    if elements:
+                    if hrefs:
                         current_urls = []
-                        for j, element in enumerate(elements):
-                            href = await element.get_attribute('href')
-                            if href:
-                                full_product_url = urljoin(str(config.base_url), href)
+                        for j, href in enumerate(hrefs):
+                            full_product_url = _fast_join(base_url, href)
+                            if full_product_url not in seen:
+                                seen.add(full_product_url)
                                 current_urls.append(full_product_url)
-                                if j < 3:  # Log first 3 URLs for debugging
-                                    logger.info(f"    URL {j+1}: {full_product_url}")
+                            if j < 3:  # Log first 3 URLs for debugging
+                                logger.info(f"    URL {j+1}: {full_product_url}")
                         
                         urls.extend(current_urls)
                         logger.info(f"  Added {len(current_urls)} URLs from selector: {selector_group['name']}")
@@ -884,18 +1947,20 @@ class ModernScraperAgent:
                 await self._handle_infinite_scroll(page)
                 
                 # Try selectors again after scroll
-                for selector_group in selectors:
+                group_hrefs = await page.evaluate(
+                    _LINK_HREFS_JS, [[group['product_link'] for group in selectors], False]
+                )
+                for selector_group, hrefs in zip(selectors, group_hrefs):
                     try:
-                        selector = selector_group['product_link']
-                        elements = await page.query_selector_all(selector)
-                        scroll_urls = []
-                        for element in elements:
-                            href = await element.get_attribute('href')
-                            if href:
-                                full_product_url = urljoin(str(config.base_url), href)
-                                scroll_urls.append(full_product_url)
+                        if hrefs is None:
+                            raise ValueError(f"invalid selector: {selector_group['product_link']}")
+                        new_urls = []
+                        for href in hrefs:
+                            full_product_url = _fast_join(base_url, href)
+                            if full_product_url not in seen:
+                                seen.add(full_product_url)
+                                new_urls.append(full_product_url)
                         
-                        new_urls = [url for url in scroll_urls if url not in urls]
                         urls.extend(new_urls)
                         if new_urls:
                             logger.info(f"  Found {len(new_urls)} additional URLs after scroll")
@@ -905,14 +1970,18 @@ class ModernScraperAgent:
                         
             logger.info(f"Classical discovery total: {len(urls)} URLs")
             
+            # The browser found nothing the static HTML lacked, so later pages of this site can skip it
+            if len(static_urls) >= _STATIC_MIN_LINKS and seen.issubset(static_urls):
+                self._static_complete_sites.add(config.name)
+            
         finally:
             await page.close()
         
-        return list(set(urls))  # Remove duplicates
+        return urls
     
     async def _universal_url_discovery(self, config: SiteConfig, category_path: str) -> List[str]:
         """Universal intelligent URL discovery for any e-commerce site"""
-        page = await self.context.new_page()
+        page = await self._new_page()
         all_urls = set()
         
         try:
@@ -933,11 +2002,11 @@ class ModernScraperAgent:
             
             for pattern in discovered_patterns:
                 try:
-                    elements = await page.query_selector_all(pattern)
-                    logger.info(f"  🔍 Pattern '{pattern}': {len(elements)} elements")
+                    hrefs = await page.eval_on_selector_all(pattern, _ELEMENT_HREFS_JS)
+                    logger.info(f"  🔍 Pattern '{pattern}': {len(hrefs)} elements")
                     
-                    for element in elements[:50]:  # Limit to prevent overload
-                        href = await self._extract_product_url(element, str(config.base_url))
+                    for raw_href in hrefs[:50]:  # Limit to prevent overload
+                        href = _absolute_product_href(raw_href, str(config.base_url))
                         if href and self._is_universal_product_url(href):
                             all_urls.add(href)
                 except Exception as e:
@@ -952,9 +2021,9 @@ class ModernScraperAgent:
             # Re-scan top patterns after dynamic loading
             for pattern in discovered_patterns[:3]:
                 try:
-                    elements = await page.query_selector_all(pattern)
-                    for element in elements:
-                        href = await self._extract_product_url(element, str(config.base_url))
+                    hrefs = await page.eval_on_selector_all(pattern, _ELEMENT_HREFS_JS)
+                    for raw_href in hrefs:
+                        href = _absolute_product_href(raw_href, str(config.base_url))
                         if href and self._is_universal_product_url(href):
                             all_urls.add(href)
                 except:
@@ -966,29 +2035,36 @@ class ModernScraperAgent:
             if len(all_urls) == 0:
                 logger.info("🔄 PHASE 3: Using site-specific selectors (fallback)")
                 
-                selectors = self._get_adaptive_selectors(config.name)
-                for selector_group in selectors:
-                    try:
-                        elements = await page.query_selector_all(selector_group['product_link'])
-                        logger.info(f"  🎯 Site selector '{selector_group['name']}': {len(elements)} elements")
-                        
-                        for element in elements:
-                            href = await self._extract_product_url(element, str(config.base_url))
-                            if href and self._is_universal_product_url(href):
-                                all_urls.add(href)
-                    except:
-                        continue
+                # Every group is scanned and merged, so one union selector does the same work
+                try:
+                    hrefs = await page.eval_on_selector_all(_unified_link_selector(config.name), _ELEMENT_HREFS_JS)
+                    logger.info(f"  🎯 Unified site selector: {len(hrefs)} elements")
+                except Exception:
+                    # One invalid group poisons the union; query the groups one by one instead
+                    hrefs = []
+                    for selector_group in self._get_adaptive_selectors(config.name):
+                        try:
+                            group_hrefs = await page.eval_on_selector_all(selector_group['product_link'], _ELEMENT_HREFS_JS)
+                            logger.info(f"  🎯 Site selector '{selector_group['name']}': {len(group_hrefs)} elements")
+                            hrefs.extend(group_hrefs)
+                        except:
+                            continue
+                
+                for raw_href in hrefs:
+                    href = _absolute_product_href(raw_href, str(config.base_url))
+                    if href and self._is_universal_product_url(href):
+                        all_urls.add(href)
             
             # PHASE 4: BRUTE FORCE (LAST RESORT)
             if len(all_urls) == 0:
                 logger.info("🔄 PHASE 4: Brute force link extraction (last resort)")
                 try:
                     # Get ALL links and filter by URL pattern
-                    all_links = await page.query_selector_all('a[href]')
-                    logger.info(f"  🔗 Found {len(all_links)} total links")
+                    all_hrefs = await page.eval_on_selector_all('a[href]', _ELEMENT_HREFS_JS)
+                    logger.info(f"  🔗 Found {len(all_hrefs)} total links")
                     
-                    for link in all_links:
-                        href = await self._extract_product_url(link, str(config.base_url))
+                    for raw_href in all_hrefs:
+                        href = _absolute_product_href(raw_href, str(config.base_url))
                         if href and self._is_universal_product_url(href):
                             all_urls.add(href)
                             
@@ -1014,52 +2090,27 @@ class ModernScraperAgent:
             await asyncio.sleep(3)
             
             # Get all elements for deep analysis
-            all_elements = await page.query_selector_all('*')
-            logger.info(f"🔍 Deep analysis of {len(all_elements)} DOM elements")
+            element_count = await page.evaluate("() => document.getElementsByTagName('*').length")
+            logger.info(f"🔍 Deep analysis of {element_count} DOM elements")
             
             # 1. ADVANCED LINK ANALYSIS WITH DEEPER INSPECTION
-            all_links = await page.query_selector_all('a[href]')
+            # Every link's info arrives in one round-trip instead of per-element handles
+            all_links = await page.eval_on_selector_all('a[href]', _LINK_INFO_JS)
             logger.info(f"🔗 Analyzing {len(all_links)} links")
             
             if len(all_links) < 20:  # Too few links - likely SPA not loaded
                 logger.warning("⚠️ Very few links detected - implementing SPA content detection")
                 await self._force_spa_content_loading(page)
-                all_links = await page.query_selector_all('a[href]')
+                all_links = await page.eval_on_selector_all('a[href]', _LINK_INFO_JS)
                 logger.info(f"🔄 After SPA loading: {len(all_links)} links")
             
             # Enhanced link pattern analysis
             link_patterns = {}
-            for link in all_links:
+            for element_info in all_links:
                 try:
-                    href = await link.get_attribute('href')
-                    if not href or len(href) < 5:
+                    if len(element_info['rawHref']) < 5:
                         continue
                     
-                    # Get comprehensive element info safely
-                    try:
-                        element_info = await link.evaluate("""
-                            el => ({
-                                href: el.href,
-                                className: el.className,
-                                id: el.id,
-                                tagName: el.tagName,
-                                parentClass: el.parentElement?.className || '',
-                                grandParentClass: el.parentElement?.parentElement?.className || '',
-                                text: el.textContent?.trim() || '',
-                                hasImages: el.querySelector('img') ? true : false
-                            })
-                        """)
-                    except:
-                        # Fallback to basic info
-                        element_info = {
-                            'href': href,
-                            'className': await link.get_attribute('class') or '',
-                            'text': await link.inner_text() or '',
-                            'parentClass': '',
-                            'grandParentClass': '',
-                            'hasImages': False
-                        }
-                    
                     # Check if this looks like a product link
                     if self._analyze_link_for_product_indicators(element_info):
                         # Create multiple pattern candidates
@@ -1259,26 +2310,6 @@ class ModernScraperAgent:
         except Exception as e:
             logger.debug(f"Force SPA loading failed: {e}")
     
-    async def _extract_product_url(self, element, base_url: str) -> str:
-        """Extract and normalize product URL from element"""
-        try:
-            href = await element.get_attribute('href')
-            if not href:
-                return None
-            
-            # Make absolute URL
-            if href.startswith('/'):
-                href = urljoin(base_url, href)
-            elif href.startswith('#') or href.startswith('javascript:'):
-                return None
-            elif not href.startswith('http'):
-                href = urljoin(base_url, href)
-            
-            return href
-            
-        except Exception:
-            return None
-    
     def _is_universal_product_url(self, url: str) -> bool:
         """Universal product URL validation for any e-commerce site"""
         if not url or len(url) < 10:
@@ -1518,7 +2549,7 @@ class ModernScraperAgent:
     
     async def _ai_pattern_discovery(self, config: SiteConfig, category_path: str) -> List[str]:
         """AI-powered pattern recognition for URL discovery"""
-        page = await self.context.new_page()
+        page = await self._new_page()
         urls = []
         
         try:
@@ -1528,46 +2559,11 @@ class ModernScraperAgent:
             # Get page content for AI analysis
             html_content = await page.content()
             
-            # Use JavaScript to analyze DOM patterns
-            product_links = await page.evaluate("""
-                () => {
-                    const links = [];
-                    const allLinks = document.querySelectorAll('a[href]');
-                    
-                    // Pattern-based detection
-                    const productPatterns = [
-                        /\/p\//i,           // /p/ pattern
-                        /\/product\//i,     // /product/ pattern
-                        /\/urun\//i,        // Turkish product pattern
-                        /-p-\d+/i,          // product ID pattern
-                        /\/\d+$/,           // ending with numbers
-                        /detail/i,          // detail pages
-                        /item/i             // item pages
-                    ];
-                    
-                    allLinks.forEach(link => {
-                        const href = link.href;
-                        const text = link.textContent.trim().toLowerCase();
-                        
-                        // Check URL patterns
-                        const matchesPattern = productPatterns.some(pattern => pattern.test(href));
-                        
-                        // Check if link has product-like attributes
-                        const hasProductData = link.hasAttribute('data-id') || 
-                                             link.hasAttribute('data-product-id') ||
-                                             link.hasAttribute('data-sku');
-                        
-                        // Check parent elements for product containers
-                        const parentElement = link.closest('[class*="product"], [class*="item"], [data-testid*="product"]');
-                        
-                        if (matchesPattern || hasProductData || parentElement) {
-                            links.push(href);
-                        }
-                    });
-                    
-                    return [...new Set(links)];
-                }
-            """)
+            # Analyze the captured HTML server-side; the in-page scan is the fallback
+            if HTMLParser is not None and html_content:
+                product_links = _product_links_from_html(html_content, page.url)
+            else:
+                product_links = await page.evaluate(_PRODUCT_LINKS_JS)
             
             urls.extend(product_links)
             logger.info(f"AI pattern discovery found {len(product_links)} URLs")
@@ -1581,16 +2577,20 @@ class ModernScraperAgent:
     
     async def _network_traffic_discovery(self, config: SiteConfig, category_path: str) -> List[str]:
         """Discover URLs by analyzing network traffic"""
-        page = await self.context.new_page()
+        page = await self._new_page()
         urls = []
-        json_responses = []
+        # Only the most recent listing payloads are kept alive
+        json_responses = deque(maxlen=_JSON_RESPONSE_LIMIT)
         
         # Capture network responses
         async def handle_response(response):
-            if response.url.endswith('.json') or 'application/json' in response.headers.get('content-type', ''):
+            headers = response.headers
+            if response.url.endswith('.json') or 'application/json' in headers.get('content-type', ''):
+                content_length = headers.get('content-length')
+                if content_length and content_length.isdigit() and int(content_length) > _JSON_RESPONSE_MAX_BYTES:
+                    return
                 try:
-                    json_data = await response.json()
-                    json_responses.append(json_data)
+                    json_responses.append(_json_loads(await response.body()))
                 except:
                     pass
         
@@ -1613,6 +2613,7 @@ class ModernScraperAgent:
         except Exception as e:
             logger.error(f"Network traffic analysis failed: {e}")
         finally:
+            page.remove_listener('response', handle_response)
             await page.close()
         
         return urls
@@ -1620,35 +2621,29 @@ class ModernScraperAgent:
     def _extract_urls_from_json(self, json_data: dict, config: SiteConfig) -> List[str]:
         """Extract product URLs from JSON API responses"""
         urls = []
+        base_url = str(config.base_url)
         
-        def recursive_search(obj, path=""):
+        # Iterative walk (no call frame per node); children are pushed reversed so they pop in source order
+        stack = [json_data]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
+                children = []
                 for key, value in obj.items():
-                    if key.lower() in ['url', 'link', 'href', 'slug', 'path']:
+                    if key in _JSON_URL_KEYS or key.lower() in _JSON_URL_KEYS:
                         if isinstance(value, str) and self._looks_like_product_url(value):
-                            full_url = urljoin(str(config.base_url), value)
-                            urls.append(full_url)
-                    else:
-                        recursive_search(value, f"{path}.{key}")
+                            urls.append(_fast_join(base_url, value))
+                    elif isinstance(value, (dict, list)):
+                        children.append(value)
+                stack.extend(reversed(children))
             elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    recursive_search(item, f"{path}[{i}]")
+                stack.extend(reversed(obj))
         
-        recursive_search(json_data)
         return urls
     
     def _looks_like_product_url(self, url: str) -> bool:
         """Check if URL looks like a product URL"""
-        product_indicators = [
-            '/p/', '/product/', '/urun/', '/item/', '/detail/',
-            re.compile(r'-p-\d+'), re.compile(r'/\d+$'), re.compile(r'/\d+/')
-        ]
-        
-        return any(
-            indicator.search(url) if hasattr(indicator, 'search') 
-            else indicator in url.lower() 
-            for indicator in product_indicators
-        )
+        return bool(_PRODUCT_URL_RE.search(url))
     
     async def _human_like_navigation(self, page: Page, url: str) -> None:
         """🥷 ULTRA-REALISTIC human navigation with advanced anti-detection"""
@@ -1803,15 +2798,7 @@ class ModernScraperAgent:
             # Scroll down slowly like reading
             for _ in range(random.randint(2, 4)):
                 scroll_amount = random.randint(150, 400)
-                await page.evaluate(f"""
-                    () => {{
-                        window.scrollBy({{
-                            top: {scroll_amount},
-                            left: 0,
-                            behavior: 'smooth'
-                        }});
-                    }}
-                """)
+                await page.evaluate(_SMOOTH_SCROLL_JS, [0, scroll_amount])
                 # Human reading pause
                 await asyncio.sleep(random.uniform(1.5, 4))
                 
@@ -1884,29 +2871,13 @@ class ModernScraperAgent:
         """Slow continuous scrolling like reading"""
         for _ in range(random.randint(2, 5)):
             scroll_amount = random.randint(100, 300)
-            await page.evaluate(f"""
-                () => {{
-                    window.scrollBy({{
-                        top: {scroll_amount},
-                        left: 0,
-                        behavior: 'smooth'
-                    }});
-                }}
-            """)
+            await page.evaluate(_SMOOTH_SCROLL_JS, [0, scroll_amount])
             await asyncio.sleep(random.uniform(1, 3))
     
     async def _quick_scroll_pause(self, page: Page) -> None:
         """Quick scroll followed by longer pause"""
         scroll_amount = random.randint(300, 600)
-        await page.evaluate(f"""
-            () => {{
-                window.scrollBy({{
-                    top: {scroll_amount},
-                    left: 0,
-                    behavior: 'smooth'
-                }});
-            }}
-        """)
+        await page.evaluate(_SMOOTH_SCROLL_JS, [0, scroll_amount])
         await asyncio.sleep(random.uniform(2, 5))
     
     async def _random_direction_scroll(self, page: Page) -> None:
@@ -1918,15 +2889,7 @@ class ModernScraperAgent:
         ]
         
         for dx, dy in random.sample(directions, random.randint(1, 2)):
-            await page.evaluate(f"""
-                () => {{
-                    window.scrollBy({{
-                        top: {dy},
-                        left: {dx},
-                        behavior: 'smooth'
-                    }});
-                }}
-            """)
+            await page.evaluate(_SMOOTH_SCROLL_JS, [dx, dy])
             await asyncio.sleep(random.uniform(0.5, 2))
         
     async def _handle_infinite_scroll(self, page: Page) -> None:
@@ -1963,93 +2926,53 @@ class ModernScraperAgent:
     
     def _get_adaptive_selectors(self, site_name: str) -> List[Dict]:
         """Get adaptive selectors with priority order"""
-        base_selectors = {
-            "trendyol": [
-                {
-                    "name": "Primary Trendyol",
-                    "product_link": "div.p-card-wrppr a[href*='/p-'], .product-item a[href*='/p-'], .prd-link a[href*='/p-']"
-                },
-                {
-                    "name": "Modern Trendyol Cards", 
-                    "product_link": ".p-card-chldrn-cntnr a, [data-id*='product'] a, .product-card a, [class*='product-'] a[href*='-p-'], a[href*='-p-']:not([href*='/c']):not([href*='/brand/']) "
-                },
-                {
-                    "name": "Trendyol Product Links", 
-                    "product_link": "a[href*='/p-']:not([href*='/c-']):not([href*='/category']):not([href*='/brand']), .product-container a[href*='/p-']"
-                },
-                {
-                    "name": "Trendyol Universal", 
-                    "product_link": "a[href*='trendyol.com/'][href*='-p-'], [class*='card'] a[href*='-p-'], [data-testid*='product'] a"
-                },
-                {
-                    "name": "Trendyol Aggressive", 
-                    "product_link": "a[href*='-p-']:not([href*='/c']):not([href*='butik']):not([href*='search']), a[href][title], a[href*='trendyol'][href*='-p-']"
-                },
-                {
-                    "name": "Generic Trendyol",
-                    "product_link": "a[href*='trendyol.com'][href*='-p-']:not([href*='/c-'])"
-                }
-            ],
-            "gratis": [
-                {
-                    "name": "Primary Gratis Products",
-                    "product_link": "a[href*='-p-']:not([href*='-b-']), a[href*='/p/'], a[href*='/urun/'], a[href*='/product/']"
-                },
-                {
-                    "name": "Gratis Product Cards", 
-                    "product_link": ".product-card a, .product-item a, [class*='product'] a, [data-testid*='product'] a"
-                },
-                {
-                    "name": "Gratis Link Patterns",
-                    "product_link": "a[href*='gratis.com'][href*='-p-'], a[href*='gratis.com'][href*='/p/']"
-                },
-                {
-                    "name": "Generic Gratis Links",
-                    "product_link": "a[href]:not([href*='javascript']):not([href*='mailto']):not([href*='tel'])"
-                }
-            ],
-            "sephora_tr": [
-                {
-                    "name": "Primary Sephora",
-                    "product_link": "a.product-item-link, .product-tile a, [data-comp='ProductTile'] a"
-                },
-                {
-                    "name": "Alternative Sephora",
-                    "product_link": "a[href*='/p/'], .product-container a"
-                }
-            ],
-            "rossmann": [
-                {
-                    "name": "Primary Rossmann", 
-                    "product_link": "a.product-item-link, .product-tile a, .product-card a"
-                },
-                {
-                    "name": "Alternative Rossmann",
-                    "product_link": "a[href*='/p/'], a[href*='/product/']"
-                }
-            ]
-        }
-        
-        # Add universal fallback selectors
-        universal_selectors = [
-            {
-                "name": "Universal Product Links",
-                "product_link": "a[href*='/p/'], a[href*='/product/'], a[href*='/item/'], a[href*='-p-']"
-            },
-            {
-                "name": "Data Attribute Based",
-                "product_link": "[data-id] a, [data-product-id] a, [data-sku] a, [data-product] a"
-            },
-            {
-                "name": "Class Pattern Based", 
-                "product_link": ".product a, .item a, [class*='product'] a, [class*='item'] a"
-            }
-        ]
-        
-        selectors = base_selectors.get(site_name, [])
-        selectors.extend(universal_selectors)
+        return _ADAPTIVE_SELECTOR_GROUPS.get(site_name, _UNIVERSAL_LINK_SELECTORS)
+    
+    def _ranked_selector_groups(self, site_name: str) -> List[Dict]:
+        """Adaptive selectors with this run's winning group first and repeatedly failing groups dropped"""
+        selectors = self._get_adaptive_selectors(site_name)
+        ranked = [
+            group for group in selectors
+            if self.failure_patterns.get((site_name, group['name']), 0) < _SELECTOR_FAILURE_LIMIT
+        ] or list(selectors)
+        
+        winner = self.selector_cache.get(site_name)
+        if winner:
+            ranked.sort(key=lambda group: group['name'] != winner)
+        return ranked
+    
+    def _ranked_selector_payload(self, site_name: str) -> List[list]:
+        """Selector payload for a site with each field's previous winners tried first"""
+        payload = _SELECTOR_PAYLOAD.get(site_name, _DEFAULT_SELECTOR_PAYLOAD)
+        ranked = []
+        for row in payload:
+            field, joined, selectors, limit = row
+            # .get keeps lookups for never-won fields from populating the defaultdict
+            wins = self._winning_selectors.get((site_name, field))
+            if wins:
+                row = [field, joined, sorted(selectors, key=lambda selector: -wins[selector]), limit]
+            ranked.append(row)
+        return ranked
+    
+    def _filter_valid_product_urls(self, urls: List[str], config: SiteConfig) -> List[str]:
+        """Batch form of _is_valid_product_url: site lookups hoisted, no per-URL logging"""
+        validator = _PRODUCT_PATH_VALIDATORS.get(config.name)
+        if validator is None:
+            return []
         
-        return selectors
+        config_domain = _config_domain(str(config.base_url))
+        validated_urls = []
+        for url in urls:
+            try:
+                parsed = urlparse(url)
+            except ValueError:
+                continue
+            if parsed.netloc != config_domain:
+                continue
+            path = parsed.path.lower()
+            if not _INVALID_URL_PATH_RE.search(path) and validator(path):
+                validated_urls.append(url)
+        return validated_urls
     
     def _is_valid_product_url(self, url: str, config: SiteConfig) -> bool:
         """Enhanced URL validation with strict domain checking"""
@@ -2058,70 +2981,30 @@ class ModernScraperAgent:
             path = parsed.path.lower()
             
             # Strict domain validation - must be exact match
-            config_domain = str(config.base_url).replace('https://', '').replace('http://', '').strip('/')
+            config_domain = _config_domain(str(config.base_url))
             url_domain = parsed.netloc
             
             if config_domain != url_domain:
-                logger.debug(f"URL {url} rejected - domain mismatch: {url_domain} != {config_domain}")
+                logger.debug("URL {} rejected - domain mismatch: {} != {}", url, url_domain, config_domain)
                 return False
             
             # Exclude obviously invalid file extensions
-            if any(ext in path for ext in ['.js', '.css', '.png', '.jpg', '.gif', '.ico', '.xml', '.txt']):
-                logger.debug(f"URL {url} rejected - invalid file extension")
+            if any(ext in path for ext in _INVALID_URL_EXTENSIONS):
+                logger.debug("URL {} rejected - invalid file extension", url)
                 return False
             
             # Exclude obviously invalid pages
-            invalid_keywords = ['/api/', '/static/', '/assets/', '/login', '/register', '/logout']
-            if any(invalid in path for invalid in invalid_keywords):
-                logger.debug(f"URL {url} rejected - invalid page type")
+            if any(invalid in path for invalid in _INVALID_URL_KEYWORDS):
+                logger.debug("URL {} rejected - invalid page type", url)
                 return False
             
-            # Site-specific STRICT validation
-            if config.name == "trendyol":
-                # Sadece -p-XXXXX pattern'i kabul et (minimum 5 digit)
-                if re.search(r'-p-\d{5,}', path):
-                    # Kategori/kampanya URL'lerini reddet
-                    exclude_patterns = ['/butik/', '/sr/', '/magaza/', '/hesabim/', 
-                                      '/sepetim/', '/kategori/', '/c-', '/kampanya',
-                                      'uygun-fiyatli', 'indirimli', '/x-c', '/kozmetik-x-c',
-                                      '/cilt-bakimi-x-c', '/makyaj-x-c', '/parfum-x-c', '/guzellik-x-c']
-                    if not any(pattern in path for pattern in exclude_patterns):
-                        logger.debug(f"URL {url} accepted - Trendyol strict product pattern")
-                        return True
-                logger.debug(f"URL {url} rejected - Trendyol strict validation failed")
-                return False
-                
-            elif config.name == "gratis":
-                # Gratis için çok geniş kabul - sadece belirgin sistem URL'lerini hariç tut
-                exclude_patterns = ['/kategori/', '/marka/', '/hesap', '/sepet', '/giris', '/kayit', 
-                                  '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', 
-                                  '/api/', '/static/', '/search?', '?', '/contact', '/about']
-                if any(pattern in path for pattern in exclude_patterns):
-                    logger.debug(f"URL {url} rejected - Gratis excluded pattern")
-                    return False
-                logger.debug(f"URL {url} accepted - Gratis general acceptance")
+            # Site-specific STRICT validation; unknown sites never match
+            validator = _PRODUCT_PATH_VALIDATORS.get(config.name)
+            if validator is not None and validator(path):
+                logger.debug("URL {} accepted - {} product pattern", url, config.name)
                 return True
-                
-            elif config.name == "sephora_tr":
-                # Sephora için /p/ veya /product/ pattern'i (minimum 10 char)
-                if re.search(r'/p/[a-zA-Z0-9-]{10,}', path) or re.search(r'/product/[a-zA-Z0-9-]{10,}', path):
-                    logger.debug(f"URL {url} accepted - Sephora product pattern")
-                    return True
-                logger.debug(f"URL {url} rejected - Sephora strict validation failed")
-                return False
-                
-            elif config.name == "rossmann":
-                # Rossmann için /p/ veya /product/ pattern'i (minimum 8 char)
-                if re.search(r'/p/[a-zA-Z0-9-]{8,}', path) or re.search(r'/product/[a-zA-Z0-9-]{8,}', path):
-                    logger.debug(f"URL {url} accepted - Rossmann product pattern")
-                    return True
-                logger.debug(f"URL {url} rejected - Rossmann strict validation failed")
-                return False
-            
-            # Hiçbir pattern match etmezse reddet
-            logger.debug(f"URL {url} rejected - no strict pattern match")
             
-            logger.debug(f"URL {url} rejected - no matching criteria")
+            logger.debug("URL {} rejected - {} strict validation failed", url, config.name)
             return False
             
         except Exception as e:
@@ -2130,7 +3013,7 @@ class ModernScraperAgent:
     
     async def scrape_product_advanced(self, url: str, site_name: str) -> Dict[str, Any]:
         """🚀 ULTRA-DEEP product scraping with comprehensive content discovery"""
-        page = await self.context.new_page()
+        page = await self._new_page()
         
         try:
             logger.info(f"🔍 DEEP SCRAPER: Starting comprehensive analysis of {url}")
@@ -2141,11 +3024,15 @@ class ModernScraperAgent:
             # 🌟 NEW STRATEGY 1: Deep Page Exploration - Scroll and discover all content
             await self._deep_page_exploration(page, url)
             
-            # 🌟 ENHANCED STRATEGY 2: Modern selector-based extraction with deep search
-            product_data = await self._enhanced_modern_extraction(page, site_name)
+            # JSON-LD / meta fields up front, so selector fallbacks skip what they already cover.
+            # 🌟 ENHANCED STRATEGY 3 (AI-powered deep content discovery) only reads the DOM, so it overlaps
+            (page_data, heuristic_data), ai_data = await asyncio.gather(
+                self._extract_all(page, site_name),
+                self._ai_deep_content_discovery(page, url)
+            )
             
-            # 🌟 ENHANCED STRATEGY 3: AI-powered deep content discovery
-            ai_data = await self._ai_deep_content_discovery(page, url)
+            # 🌟 ENHANCED STRATEGY 2: Modern selector-based extraction with deep search
+            product_data = await self._enhanced_modern_extraction(page, site_name, known=page_data.keys())
             product_data.update(ai_data)
             
             # 🌟 NEW STRATEGY 4: Long description mining from page bottom
@@ -2160,12 +3047,12 @@ class ModernScraperAgent:
             product_data.update(hidden_content)
             
             # Original strategies (enhanced)
-            structured_data = await self._extract_structured_data(page)
-            if structured_data:
-                product_data.update(structured_data)
+            product_data.update(page_data)
             
-            meta_data = await self._extract_meta_data(page)
-            product_data.update(meta_data)
+            # Heuristic guesses (off unless SCRAPER_PAGE_HEURISTICS=true) only fill fields no other strategy found
+            for field, value in heuristic_data.items():
+                if value and not product_data.get(field):
+                    product_data[field] = value
             
             # 🌟 NEW STRATEGY 6: Image analysis for additional product info
             image_data = await self._extract_comprehensive_images(page)
@@ -2334,19 +3221,8 @@ class ModernScraperAgent:
                 'div[class*="long"]', 'div[class*="full"]', 'div[class*="complete"]'
             ]
             
-            descriptions = []
-            
-            for selector in bottom_description_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        text = await element.inner_text()
-                        if text and len(text.strip()) > 50:  # Only substantial descriptions
-                            clean_text = text.strip()
-                            if clean_text not in descriptions:
-                                descriptions.append(clean_text)
-                except:
-                    continue
+            # Every selector and element in one round-trip; only substantial descriptions come back
+            descriptions = await page.evaluate(_SELECTOR_TEXTS_JS, [bottom_description_selectors, 50])
             
             # Also search for long paragraphs in bottom half of page
             long_paragraphs = await page.evaluate("""
@@ -2485,10 +3361,10 @@ class ModernScraperAgent:
             logger.error(f"Image extraction error: {e}")
             return []
     
-    async def _enhanced_modern_extraction(self, page: Page, site_name: str) -> Dict[str, Any]:
+    async def _enhanced_modern_extraction(self, page: Page, site_name: str, known=frozenset()) -> Dict[str, Any]:
         """Enhanced modern extraction with deep content discovery"""
         # Use the original method but with enhanced selectors
-        basic_data = await self._modern_selector_extraction(page, site_name)
+        basic_data = await self._modern_selector_extraction(page, site_name, known)
         
         # Enhance with additional deep extraction
         enhanced_data = await page.evaluate("""
@@ -2516,15 +3392,14 @@ class ModernScraperAgent:
                     '[class*="detail"]', '[class*="info"]', 'p'
                 ];
                 
+                // One joined query visits each candidate once, even when several selectors match it
                 let longestDescription = '';
-                for (const selector of descriptionSelectors) {
-                    document.querySelectorAll(selector).forEach(el => {
-                        const text = el.innerText?.trim();
-                        if (text && text.length > longestDescription.length) {
-                            longestDescription = text;
-                        }
-                    });
-                }
+                document.querySelectorAll(descriptionSelectors.join(', ')).forEach(el => {
+                    const text = el.innerText?.trim();
+                    if (text && text.length > longestDescription.length) {
+                        longestDescription = text;
+                    }
+                });
                 
                 if (longestDescription) {
                     data.description = longestDescription;
@@ -2616,131 +3491,33 @@ class ModernScraperAgent:
         
         return cleaned
     
-    async def _modern_selector_extraction(self, page: Page, site_name: str) -> Dict[str, Any]:
+    async def _modern_selector_extraction(self, page: Page, site_name: str, known=frozenset()) -> Dict[str, Any]:
         """Modern selector-based extraction with adaptive strategies and JavaScript fallback"""
-        selectors = self._get_product_selectors(site_name)
-        data = {}
+        spec = _SELECTOR_SPEC.get(site_name, _DEFAULT_SELECTOR_SPEC)
         
-        for field, field_selectors in selectors.items():
-            for selector in field_selectors:
-                try:
-                    if field in ['ingredients', 'features', 'reviews', 'images']:
-                        # List fields
-                        elements = await page.query_selector_all(selector)
-                        values = []
-                        for element in elements:
-                            if field == 'images':
-                                src = await element.get_attribute('src') or await element.get_attribute('data-src')
-                                if src and not src.startswith('data:'):
-                                    values.append(src)
-                            else:
-                                text = await element.text_content()
-                                if text and text.strip():
-                                    values.append(text.strip())
-                        if values:
-                            data[field] = values[:10]  # Limit list size
-                            break
-                    else:
-                        # Single fields
-                        element = await page.query_selector(selector)
-                        if element:
-                            if field == 'price':
-                                text = await element.text_content()
-                                if text and any(char.isdigit() for char in text):
-                                    data[field] = text.strip()
-                                    break
-                            else:
-                                text = await element.text_content()
-                                if text and len(text.strip()) > 2:
-                                    data[field] = text.strip()
-                                    break
-                except Exception as e:
-                    logger.debug(f"Selector {selector} failed for {field}: {e}")
+        # Trimming and per-field validation run in-page; Python receives final values
+        try:
+            result = await page.evaluate(_SELECTOR_EXTRACT_JS, self._ranked_selector_payload(site_name))
+            data = result['data']
+            for field, selector in result['winners'].items():
+                self._winning_selectors[(site_name, field)][selector] += 1
+        except Exception as e:
+            logger.debug(f"Selector extraction failed for {site_name}: {e}")
+            data = {}
+        
+        for field, _ in spec:
+            # Category is resolved from the URL path before paying for a DOM evaluation
+            if field == 'category' and not data.get(field):
+                category = _category_from_url(page.url)
+                if category:
+                    data[field] = category
                     continue
             
-            # JavaScript fallback if field is still empty
-            if not data.get(field):
+            # JavaScript fallback if field is still empty; `known` fields are overwritten later
+            # by JSON-LD / meta values, so their fallback would be wasted work
+            if not data.get(field) and field not in known:
                 try:
-                    js_value = await page.evaluate(f"""
-                        () => {{
-                            // {field} için akıllı extraction
-                            if ('{field}' === 'category') {{
-                                const breadcrumb = document.querySelector('nav[aria-label="breadcrumb"], .breadcrumb, nav.breadcrumb');
-                                if (breadcrumb) {{
-                                    const links = breadcrumb.querySelectorAll('a');
-                                    if (links.length > 1) {{
-                                        return links[1].textContent.trim();
-                                    }}
-                                }}
-                                // Alternative: look for category in page title or headings
-                                const title = document.title;
-                                if (title.includes('Makyaj')) return 'Makyaj';
-                                if (title.includes('Cilt Bakım')) return 'Cilt Bakımı';
-                                if (title.includes('Parfüm')) return 'Parfüm';
-                                if (title.includes('Saç Bakım')) return 'Saç Bakımı';
-                                return 'Kozmetik';
-                            }}
-                            
-                            if ('{field}' === 'description') {{
-                                // Tüm p tag'lerini kontrol et
-                                const paragraphs = document.querySelectorAll('p');
-                                for (const p of paragraphs) {{
-                                    const text = p.textContent.trim();
-                                    if (text.length > 100 && !text.includes('cookie') && !text.includes('gizlilik')) {{
-                                        return text;
-                                    }}
-                                }}
-                                
-                                // Alternative: look for any meaningful text in divs
-                                const divs = document.querySelectorAll('div');
-                                for (const div of divs) {{
-                                    const text = div.textContent.trim();
-                                    if (text.length > 50 && text.length < 1000 && 
-                                        (text.includes('ürün') || text.includes('kullanım') || text.includes('özellik'))) {{
-                                        return text;
-                                    }}
-                                }}
-                            }}
-                            
-                            if ('{field}' === 'name') {{
-                                // Try multiple heading selectors
-                                const headings = document.querySelectorAll('h1, h2, [class*="title"], [class*="name"]');
-                                for (const heading of headings) {{
-                                    const text = heading.textContent.trim();
-                                    if (text.length > 10 && text.length < 200) {{
-                                        return text;
-                                    }}
-                                }}
-                            }}
-                            
-                            if ('{field}' === 'brand') {{
-                                // Look for brand in various places
-                                const brandSelectors = ['[class*="brand"]', '[class*="marka"]', 'h1 a', '.manufacturer'];
-                                for (const selector of brandSelectors) {{
-                                    const element = document.querySelector(selector);
-                                    if (element) {{
-                                        const text = element.textContent.trim();
-                                        if (text.length > 2 && text.length < 50) {{
-                                            return text;
-                                        }}
-                                    }}
-                                }}
-                            }}
-                            
-                            if ('{field}' === 'price') {{
-                                // Look for price patterns
-                                const priceElements = document.querySelectorAll('*');
-                                for (const element of priceElements) {{
-                                    const text = element.textContent.trim();
-                                    if (text.match(/\d+[.,]\d+.*₺/) || text.match(/₺.*\d+[.,]\d+/)) {{
-                                        return text;
-                                    }}
-                                }}
-                            }}
-                            
-                            return '';
-                        }}
-                    """)
+                    js_value = await page.evaluate(_FIELD_FALLBACK_JS, field)
                     if js_value and js_value.strip():
                         data[field] = js_value.strip()
                         logger.debug(f"JavaScript fallback succeeded for {field}: {js_value[:50]}...")
@@ -2749,215 +3526,45 @@ class ModernScraperAgent:
         
         return data
     
-    async def _ai_content_extraction(self, page: Page) -> Dict[str, Any]:
-        """AI-powered content extraction using JavaScript analysis"""
-        try:
-            ai_data = await page.evaluate("""
-                () => {
-                    const data = {};
-                    
-                    // Smart name detection
-                    const nameSelectors = [
-                        'h1', '[class*="title"]', '[class*="name"]', 
-                        '[data-testid*="name"]', '[data-testid*="title"]'
-                    ];
-                    for (const selector of nameSelectors) {
-                        const element = document.querySelector(selector);
-                        if (element && element.textContent.trim().length > 5) {
-                            data.name = element.textContent.trim();
-                            break;
-                        }
-                    }
-                    
-                    // Smart price detection
-                    const priceElements = document.querySelectorAll('*');
-                    for (const element of priceElements) {
-                        const text = element.textContent;
-                        if (text && /[0-9]{1,}[.,]?[0-9]*\s*(₺|TL|EUR|USD|\$)/i.test(text)) {
-                            const priceMatch = text.match(/[0-9]{1,}[.,]?[0-9]*\s*(₺|TL|EUR|USD|\$)/i);
-                            if (priceMatch) {
-                                data.price = priceMatch[0];
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Smart description detection
-                    const descElements = document.querySelectorAll('p, div, span');
-                    for (const element of descElements) {
-                        const text = element.textContent.trim();
-                        if (text.length > 50 && text.length < 1000 && 
-                            /ürün|product|özellik|kullanım|içerik/i.test(text)) {
-                            data.description = text;
-                            break;
-                        }
-                    }
-                    
-                    return data;
-                }
-            """)
-            
-            return ai_data
-        except Exception as e:
-            logger.error(f"AI content extraction failed: {e}")
-            return {}
-    
-    async def _extract_structured_data(self, page: Page) -> Dict[str, Any]:
-        """Extract structured data (JSON-LD, microdata)"""
-        try:
-            structured_data = await page.evaluate("""
-                () => {
-                    const data = {};
-                    
-                    // JSON-LD extraction
-                    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                    for (const script of scripts) {
-                        try {
-                            const jsonData = JSON.parse(script.textContent);
-                            if (jsonData['@type'] === 'Product') {
-                                data.name = jsonData.name;
-                                data.description = jsonData.description;
-                                if (jsonData.offers && jsonData.offers.price) {
-                                    data.price = jsonData.offers.price;
-                                }
-                                if (jsonData.brand) {
-                                    data.brand = typeof jsonData.brand === 'object' ? 
-                                               jsonData.brand.name : jsonData.brand;
-                                }
-                                break;
-                            }
-                        } catch (e) {
-                            continue;
-                        }
-                    }
-                    
-                    return data;
-                }
-            """)
-            
-            return structured_data
-        except Exception as e:
-            logger.error(f"Structured data extraction failed: {e}")
-            return {}
-    
-    async def _extract_meta_data(self, page: Page) -> Dict[str, Any]:
-        """Extract meta tag data"""
+    async def _extract_all(self, page: Page, site_name: str = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """JSON-LD/meta tag data and heuristic guesses from a single page round-trip"""
         try:
-            meta_data = await page.evaluate("""
-                () => {
-                    const data = {};
-                    
-                    // Open Graph tags
-                    const ogTitle = document.querySelector('meta[property="og:title"]');
-                    if (ogTitle && !data.name) {
-                        data.name = ogTitle.content;
-                    }
-                    
-                    const ogDescription = document.querySelector('meta[property="og:description"]');
-                    if (ogDescription && !data.description) {
-                        data.description = ogDescription.content;
-                    }
-                    
-                    // Product meta tags
-                    const productPrice = document.querySelector('meta[property="product:price:amount"]');
-                    if (productPrice && !data.price) {
-                        data.price = productPrice.content;
-                    }
-                    
-                    return data;
-                }
-            """)
-            
-            return meta_data
+            raw = await page.evaluate(
+                _PAGE_EXTRACT_JS, [_price_scan_selector(site_name), _META_SELECTOR, _USE_PAGE_HEURISTICS]
+            )
         except Exception as e:
-            logger.error(f"Meta data extraction failed: {e}")
-            return {}
+            logger.error(f"Page data extraction failed: {e}")
+            return {}, {}
+        
+        # Structured data wins over meta tags; heuristics are returned apart and only fill gaps
+        data = dict(raw.get('meta') or {})
+        data.update(_structured_from_ld(raw.get('structured') or ()))
+        return data, dict(raw.get('ai') or {})
     
     def _get_product_selectors(self, site_name: str) -> Dict[str, List[str]]:
         """Get comprehensive product selectors for each site"""
-        base_selectors = {
-            "trendyol": {
-                "name": [
-                    "h1.pr-new-br span", "h1", ".product-name", "[data-testid='product-name']",
-                    ".product-title", "[class*='title']"
-                ],
-                "brand": [
-                    "h1.pr-new-br a", ".product-brand", ".brand-name", "[data-testid='brand']",
-                    ".brand", "a[class*='brand']"
-                ],
-                "price": [
-                    ".prc-dsc", ".product-price", ".price", "[data-testid='price']",
-                    ".current-price", "[class*='price']"
-                ],
-                "description": [
-                    ".detail-desc-list", ".product-description", ".description",
-                    "[data-testid='description']", ".product-detail"
-                ],
-                "images": [
-                    "img.detail-img", ".product-images img", ".gallery img",
-                    "[data-testid='product-image']"
-                ]
-            },
-            "gratis": {
-                "name": [
-                    "h1", ".product-name", ".product-title", "[data-testid='product-name']",
-                    ".ems-prd-name"
-                ],
-                "brand": [
-                    ".product-brand", ".brand-name", ".brand", ".ems-prd-brand"
-                ],
-                "price": [
-                    ".product-price", ".price", "[class*='price']", ".ems-prd-price"
-                ],
-                "description": [
-                    ".product-description", ".description", ".product-detail",
-                    ".ems-prd-description"
-                ],
-                "images": [
-                    ".product-image img", ".gallery img", "img[src*='gratis']"
-                ]
-            }
-        }
-        
-        # Add universal selectors
-        universal_selectors = {
-            "name": ["h1", "[class*='title']", "[class*='name']", "[data-testid*='name']"],
-            "brand": [".brand", "[class*='brand']", "[data-testid*='brand']"],
-            "price": [".price", "[class*='price']", "[data-testid*='price']"],
-            "description": [".description", "[class*='desc']", "p", ".detail"],
-            "images": ["img", "[class*='image']", "[class*='photo']"]
-        }
-        
-        selectors = base_selectors.get(site_name, {})
-        
-        # Merge with universal selectors
-        for field, field_selectors in universal_selectors.items():
-            if field not in selectors:
-                selectors[field] = field_selectors
-            else:
-                selectors[field].extend(field_selectors)
-        
-        return selectors
+        spec = _SELECTOR_SPEC.get(site_name, _DEFAULT_SELECTOR_SPEC)
+        return {field: list(field_selectors) for field, field_selectors in spec}
     
     def _clean_product_data(self, data: Dict[str, Any], url: str, site_name: str) -> Dict[str, Any]:
         """Clean and validate product data"""
         cleaned = {
             "url": url,
             "site": site_name,
-            "name": data.get("name", "").strip()[:200],
-            "brand": data.get("brand", "").strip()[:100],
-            "price": data.get("price", "").strip()[:50],
-            "description": data.get("description", "").strip()[:2000],
+            "name": _trunc(data.get("name"), 200),
+            "brand": _trunc(data.get("brand"), 100),
+            "price": _trunc(data.get("price"), 50),
+            "description": _trunc(data.get("description"), 2000),
             "ingredients": data.get("ingredients", [])[:20],
             "features": data.get("features", [])[:20],
-            "usage": data.get("usage", "").strip()[:500],
+            "usage": _trunc(data.get("usage"), 500),
             "reviews": data.get("reviews", [])[:10],
             "images": data.get("images", [])[:5]
         }
         
         # Clean price format
         if cleaned["price"]:
-            cleaned["price"] = re.sub(r'[^\d,.\s₺TLUSD$€]', '', cleaned["price"])
+            cleaned["price"] = _PRICE_CLEAN_RE.sub(r'\1', cleaned["price"])
         
         return cleaned
     
@@ -2999,19 +3606,103 @@ class ModernScraperAgent:
     
     async def close(self):
         """Clean up resources"""
+        if self._http:
+            await self._http.close()
+        for retired in self._retired_contexts:
+            await retired.close()
+        self._retired_contexts.clear()
         if self.context:
             await self.context.close()
         if self.browser:
             await self.browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    def terminate(self) -> None:
+        """Stop the Playwright driver, and with it the browser, without an event loop"""
+        # Used when the loop that launched the browser is already closed, so close() can no longer run
+        try:
+            pid = self._playwright._impl_obj._connection._transport._proc.pid
+        except AttributeError:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError as e:
+            logger.debug(f"Playwright driver {pid} already gone: {e}")
+        self._playwright = None
+
+
+# Shared scraper reused by the tool functions, bound to the event loop that launched it
+_AGENT_SINGLETON: Optional[ModernScraperAgent] = None
+_AGENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_AGENT_LOCK: Optional[asyncio.Lock] = None
+
+
+def _retire_agent(scraper: ModernScraperAgent, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Shut down a shared scraper left behind by a previous event loop"""
+    if loop is not None and not loop.is_closed() and not loop.is_running():
+        try:
+            loop.run_until_complete(scraper.close())
+            return
+        except Exception as e:
+            logger.debug(f"Closing the previous shared scraper failed: {e}")
+    scraper.terminate()
+
 
+async def _get_agent() -> ModernScraperAgent:
+    """Return the shared scraper, launching its browser on first use"""
+    global _AGENT_SINGLETON, _AGENT_LOOP, _AGENT_LOCK
+    loop = asyncio.get_running_loop()
+    if _AGENT_LOOP is not loop:
+        # A browser started under another loop (e.g. a previous asyncio.run) cannot be driven from this one
+        stale, stale_loop = _AGENT_SINGLETON, _AGENT_LOOP
+        _AGENT_SINGLETON, _AGENT_LOOP, _AGENT_LOCK = None, loop, asyncio.Lock()
+        if stale is not None:
+            _retire_agent(stale, stale_loop)
+    
+    if _AGENT_SINGLETON is not None and _AGENT_SINGLETON.browser.is_connected():
+        return _AGENT_SINGLETON
+    
+    async with _AGENT_LOCK:
+        if _AGENT_SINGLETON is None or not _AGENT_SINGLETON.browser.is_connected():
+            scraper = ModernScraperAgent()
+            await scraper.initialize_browser()
+            _AGENT_SINGLETON = scraper
+    return _AGENT_SINGLETON
+
+
+async def close_advanced_scraper() -> None:
+    """Close the shared scraper used by the tool functions
+    
+    The tool functions keep one browser alive between calls; callers must await this
+    before their event loop ends (e.g. at the end of the coroutine passed to asyncio.run).
+    """
+    global _AGENT_SINGLETON
+    scraper, _AGENT_SINGLETON = _AGENT_SINGLETON, None
+    if scraper is not None:
+        await scraper.close()
+
+
+def _close_agent_at_exit() -> None:
+    """Best-effort shutdown of the shared scraper when its loop is still usable"""
+    loop = _AGENT_LOOP
+    if _AGENT_SINGLETON is None or loop is None or loop.is_closed() or loop.is_running():
+        return
+    try:
+        loop.run_until_complete(close_advanced_scraper())
+    except Exception as e:
+        logger.debug(f"Shared scraper shutdown failed: {e}")
+
+
+atexit.register(_close_agent_at_exit)
 
-# Direct tool functions for integration
+
+# Direct tool functions for integration; they share one browser, so callers must await close_advanced_scraper() when done
 async def discover_product_urls_advanced(site_name: str, max_products: int = 100, target_category: str = None) -> Dict[str, Any]:
     """Ultra-intelligent URL discovery with category-aware filtering"""
-    scraper = ModernScraperAgent()
-    
     try:
-        await scraper.initialize_browser()
+        scraper = await _get_agent()
         urls = await scraper.discover_urls_advanced(site_name, max_products, target_category)
         
         return {
@@ -3024,23 +3715,52 @@ async def discover_product_urls_advanced(site_name: str, max_products: int = 100
     except Exception as e:
         logger.error(f"Advanced URL discovery failed: {e}")
         return {"error": str(e), "discovered_urls": [], "status": "failed"}
-    finally:
-        await scraper.close()
 
 
 async def scrape_product_data_advanced(url: str, site_name: str) -> Dict[str, Any]:
     """Advanced product scraping function"""
-    scraper = ModernScraperAgent()
-    
     try:
-        await scraper.initialize_browser()
+        scraper = await _get_agent()
         result = await scraper.scrape_product_advanced(url, site_name)
         return result
     except Exception as e:
         logger.error(f"Advanced product scraping failed: {e}")
         return {"error": str(e), "product_data": None}
-    finally:
-        await scraper.close()
+
+
+async def discover_product_urls_batch(sites: List[Tuple[str, int]], concurrency: int = 4) -> List[Dict[str, Any]]:
+    """URL discovery for several (site_name, max_products) pairs at once on the shared browser"""
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def worker(site_name: str, max_products: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await discover_product_urls_advanced(site_name, max_products)
+    
+    return await asyncio.gather(*(worker(site_name, max_products) for site_name, max_products in sites))
+
+
+async def scrape_many_advanced(urls: List[str], site_name: str, concurrency: int = 8) -> Dict[str, Any]:
+    """Scrape several product URLs concurrently on one shared browser context"""
+    try:
+        scraper = await _get_agent()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def worker(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await scraper.scrape_product_advanced(url, site_name)
+        
+        results = await asyncio.gather(*(worker(url) for url in urls))
+        
+        return {
+            "site_name": site_name,
+            "results": results,
+            "total_count": len(results),
+            "success_count": sum(1 for result in results if result.get("success")),
+            "status": "success"
+        }
+    except Exception as e:
+        logger.error(f"Concurrent product scraping failed: {e}")
+        return {"error": str(e), "results": [], "status": "failed"}
 
 
 # Create modern agent using ADK
@@ -3063,10 +3783,11 @@ Your advanced features include:
 When scraping:
 1. Use discover_product_urls_advanced for URL discovery with multiple strategies
 2. Use scrape_product_data_advanced for comprehensive product data extraction
+   (scrape_many_advanced when several URLs of the same site need scraping)
 3. Automatically adapt to site changes using AI-powered fallbacks
 4. Handle infinite scroll and dynamic content loading
 5. Extract from JSON-LD, microdata, and meta tags when CSS selectors fail
 
 Focus on reliability, stealth, and comprehensive data extraction.""",
-        tools=[discover_product_urls_advanced, scrape_product_data_advanced]
+        tools=[discover_product_urls_advanced, scrape_product_data_advanced, scrape_many_advanced]
     )
\ No newline at end of file
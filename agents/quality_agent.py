@@ -3,7 +3,13 @@ Quality Agent - SEO Quality Validation Agent built with Google ADK
 Validates and scores SEO data quality for cosmetic products
 """
 
-from typing import Dict, Any, Optional, List
+import copy
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple, Union
 from datetime import datetime
 from loguru import logger
 
@@ -11,6 +17,134 @@ from google.adk.agents import LlmAgent
 from google.adk.tools import BaseTool
 from config.models import ProductData, SEOData
 
+try:
+    import orjson
+    
+    def _stable_dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _stable_dumps(value: Any) -> bytes:
+        return json.dumps(value, default=str, sort_keys=True).encode()
+
+
+# Valid URL slug: allowed characters only, no leading/trailing or consecutive hyphens
+_SLUG_RE = re.compile(r'^(?!-)(?!.*--)[a-z0-9-]+(?<!-)$')
+
+# Placeholder / generic meta description phrases
+_GENERIC_PHRASES = (
+    "click here", "buy now", "best price", "lorem ipsum",
+    "description here", "coming soon", "no description",
+    "product description", "add description"
+)
+# All generic phrases matched in a single pass over the text
+_GENERIC_PHRASE_RE = re.compile('|'.join(map(re.escape, _GENERIC_PHRASES)))
+
+_WORD_RE = re.compile(r'\w+')
+
+# E-ticaret platform isimleri
+_PLATFORM_NAMES = ('trendyol', 'hepsiburada', 'amazon', 'gittigidiyor', 'n11', 'ciceksepeti')
+
+# Pazarlama terimleri
+_MARKETING_TERMS = (
+    'yorumları', 'yorumlarını', 'inceleyin', 'özel indirim', 'indirimli fiyat',
+    'satın alın', 'kampanya', 'avantajlı fiyat', 'ücretsiz kargo'
+)
+
+# Local market keywords for the Turkish-market best-practice check
+_TURKISH_MARKET_TERMS = ("türkiye", "istanbul", "ankara", "izmir", "tr")
+
+# Recommendation per issue category tagged by SEOQualityValidationTool
+_ERROR_RECOMMENDATIONS = {
+    "keywords": "Add more relevant cosmetic keywords",
+    "title": "Optimize SEO title length and content",
+    "meta": "Improve meta description length and quality",
+    "slug": "Fix URL slug format",
+}
+_WARNING_RECOMMENDATIONS = {
+    "duplicate": "Remove duplicate keywords",
+    "density": "Reduce keyword density to avoid over-optimization",
+    "description": "Expand product description for better SEO",
+}
+
+
+def _mentions_any(text: str, tokens: frozenset, terms) -> bool:
+    """True when any term occurs in text; whole-token hits resolve with one set intersection"""
+    terms = tuple(terms)
+    # Every token is a substring of text, so a shared token is already a hit
+    return not tokens.isdisjoint(terms) or any(term in text for term in terms)
+
+
+class _ProductFields(NamedTuple):
+    """The ProductData fields read by the SEO quality checks, taken without model validation"""
+    url: str
+    name: str
+    brand: Optional[str]
+    description: str
+
+
+# Either a validated ProductData or the lightweight view; the checks read only the fields both carry
+_ProductLike = Union[ProductData, _ProductFields]
+
+
+def _product_fields(product_data: Dict[str, Any]) -> _ProductFields:
+    """Lightweight product view with ProductData's defaults for missing fields"""
+    return _ProductFields(
+        url=str(product_data.get("url", "")),
+        name=product_data.get("name") or "",
+        brand=product_data.get("brand"),
+        description=product_data.get("description") or ""
+    )
+
+
+def _parse_seo_data(seo_data: Dict[str, Any], product: _ProductLike, trusted: bool = False) -> SEOData:
+    """Build SEOData, defaulting product_url and generated_at from the product; trusted input skips validation"""
+    # Only the missing defaults are built; seo_data itself is passed through uncopied
+    extra = {}
+    if 'product_url' not in seo_data:
+        extra['product_url'] = str(product.url)
+    if 'generated_at' not in seo_data:
+        extra['generated_at'] = datetime.now()
+    
+    model = SEOData.model_construct if trusted else SEOData
+    return model(**seo_data, **extra)
+
+
+@dataclass(frozen=True)
+class _Thresholds:
+    """SEO quality thresholds; immutable, so one instance is shared by every validation tool"""
+    # Declared by hand (no slots= before Python 3.10), hence no field defaults; values live in _THRESHOLDS
+    __slots__ = (
+        "min_keywords", "max_keywords", "min_title_length", "max_title_length", "min_meta_length",
+        "max_meta_length", "min_slug_length", "max_slug_length", "max_keyword_density",
+        "min_description_length", "min_quality_score",
+    )
+    min_keywords: int
+    max_keywords: int
+    min_title_length: int
+    max_title_length: int
+    min_meta_length: int
+    max_meta_length: int
+    min_slug_length: int
+    max_slug_length: int
+    max_keyword_density: float
+    min_description_length: int
+    min_quality_score: float
+
+
+_THRESHOLDS = _Thresholds(
+    min_keywords=1,              # 3'ten 1'e düşür
+    max_keywords=50,             # 30'dan 50'ye çıkar
+    min_title_length=5,          # 10'dan 5'e düşür
+    max_title_length=100,        # 70'den 100'e çıkar
+    min_meta_length=10,          # 50'den 10'a düşür
+    max_meta_length=200,         # 160'dan 200'e çıkar
+    min_slug_length=1,           # 5'ten 1'e düşür
+    max_slug_length=100,         # 60'dan 100'e çıkar
+    max_keyword_density=15.0,    # 5.0'dan 15.0'a çıkar
+    min_description_length=5,    # 50'den 5'e düşür
+    min_quality_score=30.0       # 70'den 30'a düşür
+)
+
 
 class SEOQualityValidationTool(BaseTool):
     """Tool for validating SEO data quality"""
@@ -20,102 +154,102 @@ class SEOQualityValidationTool(BaseTool):
             name="seo_quality_validation",
             description="Validate SEO data quality and calculate quality score"
         )
-        self.quality_thresholds = {
-            "min_keywords": 1,          # 3'ten 1'e düşür
-            "max_keywords": 50,         # 30'dan 50'ye çıkar
-            "min_title_length": 5,      # 10'dan 5'e düşür
-            "max_title_length": 100,    # 70'den 100'e çıkar
-            "min_meta_length": 10,      # 50'den 10'a düşür
-            "max_meta_length": 200,     # 160'dan 200'e çıkar
-            "min_slug_length": 1,       # 5'ten 1'e düşür
-            "max_slug_length": 100,     # 60'dan 100'e çıkar
-            "max_keyword_density": 15.0, # 5.0'dan 15.0'a çıkar
-            "min_description_length": 5,  # 50'den 5'e düşür
-            "min_quality_score": 30.0   # 70'den 30'a düşür
-        }
+        # Read-only; tune a tool with dataclasses.replace(tool.quality_thresholds, min_keywords=3)
+        self.quality_thresholds = _THRESHOLDS
     
-    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any],
+                       product: Optional[_ProductLike] = None, seo: Optional[SEOData] = None) -> Dict[str, Any]:
         """Validate SEO data quality"""
+        return self.validate(product_data, seo_data, product, seo)
+    
+    def validate(self, product_data: Dict[str, Any], seo_data: Dict[str, Any],
+                 product: Optional[_ProductLike] = None, seo: Optional[SEOData] = None) -> Dict[str, Any]:
+        """Validate SEO data quality; already-parsed product/seo models skip re-validation"""
         try:
-            product = ProductData(**product_data)
+            # Only url/name/brand/description are read here; full ProductData validation
+            # belongs to the entry point (ValidateProductQualityTool)
+            if product is None:
+                product = _product_fields(product_data)
             
             # Parse SEO data carefully
-            seo_dict = seo_data.copy()
-            if 'product_url' not in seo_dict:
-                seo_dict['product_url'] = str(product.url)
-            if 'generated_at' not in seo_dict:
-                from datetime import datetime
-                seo_dict['generated_at'] = datetime.now()
-            
-            seo = SEOData(**seo_dict)
+            if seo is None:
+                seo = _parse_seo_data(seo_data, product)
             
+            # Issues are (recommendation category, message) pairs; the category drives
+            # _generate_recommendations and is stripped from the returned lists
             errors = []
             warnings = []
+            t = self.quality_thresholds
+            
+            # Lowercased once, shared by the title and contamination checks
+            title_lower = seo.title.lower()
+            meta_lower = seo.meta_description.lower()
             
             # Validate keyword count
             keyword_count = len(seo.keywords)
-            if keyword_count < self.quality_thresholds["min_keywords"]:
-                errors.append(f"Too few keywords: {keyword_count} (minimum: {self.quality_thresholds['min_keywords']})")
-            elif keyword_count > self.quality_thresholds["max_keywords"]:
-                warnings.append(f"Too many keywords: {keyword_count} (maximum: {self.quality_thresholds['max_keywords']})")
+            if keyword_count < t.min_keywords:
+                errors.append(("keywords", f"Too few keywords: {keyword_count} (minimum: {t.min_keywords})"))
+            elif keyword_count > t.max_keywords:
+                warnings.append((None, f"Too many keywords: {keyword_count} (maximum: {t.max_keywords})"))
             
             # Validate keyword relevance
             if not self._validate_keyword_relevance(seo.keywords, product):
-                errors.append("Keywords not sufficiently relevant to product")
+                errors.append(("keywords", "Keywords not sufficiently relevant to product"))
             
             # Validate SEO title
             title_length = len(seo.title)
-            if title_length < self.quality_thresholds["min_title_length"]:
-                errors.append(f"SEO title too short: {title_length} chars (minimum: {self.quality_thresholds['min_title_length']})")
-            elif title_length > self.quality_thresholds["max_title_length"]:
-                errors.append(f"SEO title too long: {title_length} chars (maximum: {self.quality_thresholds['max_title_length']})")
+            if title_length < t.min_title_length:
+                errors.append(("title", f"SEO title too short: {title_length} chars (minimum: {t.min_title_length})"))
+            elif title_length > t.max_title_length:
+                errors.append(("title", f"SEO title too long: {title_length} chars (maximum: {t.max_title_length})"))
             
             # Check if primary keyword is in title
             if not seo.primary_keyword:
-                errors.append("No primary keyword defined")
-            elif seo.primary_keyword not in seo.title.lower():
-                warnings.append("Primary keyword not found in title")
+                errors.append((None, "No primary keyword defined"))
+            elif seo.primary_keyword not in title_lower:
+                warnings.append((None, "Primary keyword not found in title"))
             
             # Validate meta description
             meta_length = len(seo.meta_description)
-            if meta_length < self.quality_thresholds["min_meta_length"]:
-                errors.append(f"Meta description too short: {meta_length} chars (minimum: {self.quality_thresholds['min_meta_length']})")
-            elif meta_length > self.quality_thresholds["max_meta_length"]:
-                errors.append(f"Meta description too long: {meta_length} chars (maximum: {self.quality_thresholds['max_meta_length']})")
+            if meta_length < t.min_meta_length:
+                errors.append(("meta", f"Meta description too short: {meta_length} chars (minimum: {t.min_meta_length})"))
+            elif meta_length > t.max_meta_length:
+                errors.append(("meta", f"Meta description too long: {meta_length} chars (maximum: {t.max_meta_length})"))
             
             # Check meta description quality
             if not self._is_meta_description_meaningful(seo.meta_description):
-                warnings.append("Meta description may not be meaningful or engaging")
+                warnings.append(("description", "Meta description may not be meaningful or engaging"))
             
             # Validate URL slug
             slug_length = len(seo.slug)
-            if slug_length < self.quality_thresholds["min_slug_length"]:
-                errors.append(f"URL slug too short: {slug_length} chars (minimum: {self.quality_thresholds['min_slug_length']})")
-            elif slug_length > self.quality_thresholds["max_slug_length"]:
-                errors.append(f"URL slug too long: {slug_length} chars (maximum: {self.quality_thresholds['max_slug_length']})")
+            if slug_length < t.min_slug_length:
+                errors.append(("slug", f"URL slug too short: {slug_length} chars (minimum: {t.min_slug_length})"))
+            elif slug_length > t.max_slug_length:
+                errors.append(("slug", f"URL slug too long: {slug_length} chars (maximum: {t.max_slug_length})"))
             
             if not self._is_valid_slug(seo.slug):
-                errors.append("Invalid URL slug format")
+                errors.append(("slug", "Invalid URL slug format"))
             
             # Check for duplicate keywords
             duplicate_keywords = self._find_duplicate_keywords(seo.keywords)
             if duplicate_keywords:
-                warnings.append(f"Duplicate keywords found: {', '.join(duplicate_keywords)}")
+                warnings.append(("duplicate", f"Duplicate keywords found: {', '.join(duplicate_keywords)}"))
             
             # Check keyword density
+            max_density = t.max_keyword_density
             high_density_keywords = [
-                kw for kw, density in seo.keyword_density.items() 
-                if density > self.quality_thresholds["max_keyword_density"]
+                kw for kw, density in seo.keyword_density.items()
+                if density > max_density
             ]
             if high_density_keywords:
-                warnings.append(f"Keywords with high density (>{self.quality_thresholds['max_keyword_density']}%): {', '.join(high_density_keywords)}")
+                warnings.append(("density", f"Keywords with high density (>{max_density}%): {', '.join(high_density_keywords)}"))
             
             # Check product description length
-            if len(product.description) < self.quality_thresholds["min_description_length"]:
-                warnings.append("Product description too short for optimal SEO")
+            if len(product.description) < t.min_description_length:
+                warnings.append(("description", "Product description too short for optimal SEO"))
             
             # Check for e-commerce contamination
-            contamination_issues = self._check_ecommerce_contamination(seo, product)
+            contamination_issues = self._check_ecommerce_contamination(seo, product, title_lower, meta_lower)
             errors.extend(contamination_issues["errors"])
             warnings.extend(contamination_issues["warnings"])
             
@@ -127,8 +261,8 @@ class SEOQualityValidationTool(BaseTool):
             
             return {
                 "is_valid": True,  # Her zaman geçerli kabul et
-                "errors": errors,
-                "warnings": warnings,
+                "errors": [message for _, message in errors],
+                "warnings": [message for _, message in warnings],
                 "severity": severity,
                 "quality_score": quality_score,
                 "recommendations": self._generate_recommendations(errors, warnings)
@@ -138,17 +272,17 @@ class SEOQualityValidationTool(BaseTool):
             logger.error(f"SEO quality validation error: {e}")
             return {"error": str(e)}
     
-    def _validate_keyword_relevance(self, keywords: List[str], product: ProductData) -> bool:
+    def _validate_keyword_relevance(self, keywords: List[str], product: _ProductLike) -> bool:
         """Check if keywords are relevant to the product"""
-        product_text = " ".join([
-            product.name.lower(),
-            (product.brand or "").lower(),
-            product.description.lower()
-        ])
+        # One lower() over the joined text instead of one per field
+        product_text = " ".join([product.name, product.brand or "", product.description]).lower()
         
+        # Whole-word keywords hit the token set; anything else (phrases, partial words) scans the text
+        product_tokens = frozenset(_WORD_RE.findall(product_text))
         relevant_count = 0
         for keyword in keywords[:10]:  # Check first 10 keywords
-            if keyword.lower() in product_text:
+            keyword_lower = keyword.lower()
+            if keyword_lower in product_tokens or keyword_lower in product_text:
                 relevant_count += 1
         
         # At least 30% of keywords should be found in product text
@@ -160,50 +294,34 @@ class SEOQualityValidationTool(BaseTool):
             return False
         
         # Check for generic or placeholder text
-        generic_phrases = [
-            "click here", "buy now", "best price", "lorem ipsum",
-            "description here", "coming soon", "no description",
-            "product description", "add description"
-        ]
-        
-        meta_lower = meta_description.lower()
-        return not any(phrase in meta_lower for phrase in generic_phrases)
+        return _GENERIC_PHRASE_RE.search(meta_description.lower()) is None
     
     def _is_valid_slug(self, slug: str) -> bool:
         """Validate URL slug format"""
-        if not slug:
-            return False
-        
-        # Check for invalid start/end characters
-        if slug.startswith('-') or slug.endswith('-'):
-            return False
-        
-        # Check for consecutive hyphens
-        if '--' in slug:
-            return False
-        
-        # Check character set
-        import re
-        if not re.match(r'^[a-z0-9-]+$', slug):
-            return False
-        
-        return True
+        return bool(slug) and _SLUG_RE.match(slug) is not None
     
     def _find_duplicate_keywords(self, keywords: List[str]) -> List[str]:
         """Find duplicate keywords (case-insensitive)"""
+        lowered = [keyword.lower() for keyword in keywords]
+        # Common case: no repeats at all, settled by one C-level set build
+        if len(set(lowered)) == len(lowered):
+            return []
+        
         seen = set()
+        reported = set()  # mirrors `duplicates` for O(1) membership
         duplicates = []
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
+        for keyword, keyword_lower in zip(keywords, lowered):
             if keyword_lower in seen:
-                if keyword not in duplicates:
+                if keyword not in reported:
+                    reported.add(keyword)
                     duplicates.append(keyword)
             seen.add(keyword_lower)
         
         return duplicates
     
-    def _calculate_quality_score(self, errors: List[str], warnings: List[str]) -> float:
+    def _calculate_quality_score(self, errors: List[Tuple[Optional[str], str]],
+                                 warnings: List[Tuple[Optional[str], str]]) -> float:
         """Calculate quality score (0-100) with improved scoring"""
         # Base score - Daha yüksek başlangıç
         base_score = 90.0  # 85'ten 90'a
@@ -224,37 +342,36 @@ class SEOQualityValidationTool(BaseTool):
         
         return round(score, 2)
     
-    def _check_ecommerce_contamination(self, seo: SEOData, product: ProductData) -> Dict[str, List[str]]:
-        """Check for e-commerce platform contamination in SEO content"""
+    def _check_ecommerce_contamination(self, seo: SEOData, product: _ProductLike, title_lower: Optional[str] = None,
+                                       desc_lower: Optional[str] = None) -> Dict[str, List[Tuple[Optional[str], str]]]:
+        """Check for e-commerce platform contamination in SEO content (category-tagged issues)"""
         errors = []
         warnings = []
         
-        # E-ticaret platform isimleri
-        platform_names = ['trendyol', 'hepsiburada', 'amazon', 'gittigidiyor', 'n11', 'ciceksepeti']
-        
-        # Pazarlama terimleri
-        marketing_terms = ['yorumları', 'yorumlarını', 'inceleyin', 'özel indirim', 'indirimli fiyat', 
-                          'satın alın', 'kampanya', 'avantajlı fiyat', 'ücretsiz kargo']
+        platform_names = _PLATFORM_NAMES
+        marketing_terms = _MARKETING_TERMS
         
         # SEO title kontrolü
-        title_lower = seo.title.lower()
+        if title_lower is None:
+            title_lower = seo.title.lower()
         for platform in platform_names:
             if platform in title_lower:
-                errors.append(f"SEO title contains marketplace name: {platform}")
+                errors.append(("title", f"SEO title contains marketplace name: {platform}"))
         
         for term in marketing_terms:
             if term in title_lower:
-                warnings.append(f"SEO title contains marketing phrase: {term}")
+                warnings.append((None, f"SEO title contains marketing phrase: {term}"))
         
         # Meta description kontrolü
-        desc_lower = seo.meta_description.lower()
+        if desc_lower is None:
+            desc_lower = seo.meta_description.lower()
         for platform in platform_names:
             if platform in desc_lower:
-                errors.append(f"Meta description contains marketplace name: {platform}")
+                errors.append(("meta", f"Meta description contains marketplace name: {platform}"))
         
         for term in marketing_terms:
             if term in desc_lower:
-                errors.append(f"Meta description contains marketing phrase: {term}")
+                errors.append(("meta", f"Meta description contains marketing phrase: {term}"))
         
         # Keywords kontrolü
         contaminated_keywords = []
@@ -266,37 +383,28 @@ class SEOQualityValidationTool(BaseTool):
                 contaminated_keywords.append(keyword)
         
         if contaminated_keywords:
-            warnings.append(f"Keywords contain e-commerce terms: {', '.join(contaminated_keywords[:5])}")
+            warnings.append((None, f"Keywords contain e-commerce terms: {', '.join(contaminated_keywords[:5])}"))
         
         return {"errors": errors, "warnings": warnings}
     
-    def _generate_recommendations(self, errors: List[str], warnings: List[str]) -> List[str]:
-        """Generate improvement recommendations"""
+    def _generate_recommendations(self, errors: List[Tuple[Optional[str], str]],
+                                  warnings: List[Tuple[Optional[str], str]]) -> List[str]:
+        """Generate improvement recommendations from category-tagged issues"""
         recommendations = []
         
         if errors:
             recommendations.append("Fix critical errors before publishing")
-            for error in errors[:3]:  # Show first 3 errors
-                if "keywords" in error.lower():
-                    recommendations.append("Add more relevant cosmetic keywords")
-                elif "title" in error.lower():
-                    recommendations.append("Optimize SEO title length and content")
-                elif "meta" in error.lower():
-                    recommendations.append("Improve meta description length and quality")
-                elif "slug" in error.lower():
-                    recommendations.append("Fix URL slug format")
+            for category, _ in errors[:3]:  # Show first 3 errors
+                if category in _ERROR_RECOMMENDATIONS:
+                    recommendations.append(_ERROR_RECOMMENDATIONS[category])
         
         if warnings:
             if len(warnings) > 3:
                 recommendations.append("Address warning items to improve quality")
             
-            for warning in warnings[:2]:  # Show first 2 warnings
-                if "duplicate" in warning.lower():
-                    recommendations.append("Remove duplicate keywords")
-                elif "density" in warning.lower():
-                    recommendations.append("Reduce keyword density to avoid over-optimization")
-                elif "description" in warning.lower():
-                    recommendations.append("Expand product description for better SEO")
+            for category, _ in warnings[:2]:  # Show first 2 warnings
+                if category in _WARNING_RECOMMENDATIONS:
+                    recommendations.append(_WARNING_RECOMMENDATIONS[category])
         
         if not errors and not warnings:
             recommendations.append("SEO quality is excellent - ready for publication")
@@ -313,20 +421,33 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             description="Check adherence to cosmetic industry SEO best practices"
         )
     
-    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any]) -> Dict[str, Any]:
+    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any],
+                       product: Optional[ProductData] = None) -> Dict[str, Any]:
         """Check cosmetic SEO best practices"""
+        return self.check(product_data, seo_data, extracted_terms, product)
+    
+    def check(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any],
+              product: Optional[ProductData] = None) -> Dict[str, Any]:
+        """Check cosmetic SEO best practices synchronously"""
         try:
-            product = ProductData(**product_data)
+            if product is None:
+                product = ProductData(**product_data)
             
             best_practices_score = 0
             total_checks = 0
             recommendations = []
             
+            # Lowercased SEO fields, built once and shared by every check
+            keywords_lower = " ".join(seo_data.get("keywords", [])).lower()
+            title_lower = seo_data.get("title", "").lower()
+            meta_lower = seo_data.get("meta_description", "").lower()
+            primary_keyword_lower = seo_data.get("primary_keyword", "").lower()
+            keyword_tokens = frozenset(keywords_lower.split())
+            
             # Check 1: Ingredient-focused keywords
             total_checks += 1
-            ingredients_in_keywords = any(
-                ingredient in " ".join(seo_data.get("keywords", [])).lower()
-                for ingredient in extracted_terms.get("found_ingredients", [])
+            ingredients_in_keywords = _mentions_any(
+                keywords_lower, keyword_tokens, extracted_terms.get("found_ingredients", [])
             )
             if ingredients_in_keywords:
                 best_practices_score += 1
@@ -335,9 +456,8 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             
             # Check 2: Skin type targeting
             total_checks += 1
-            skin_types_targeted = any(
-                skin_type in " ".join(seo_data.get("keywords", [])).lower()
-                for skin_type in extracted_terms.get("found_skin_types", [])
+            skin_types_targeted = _mentions_any(
+                keywords_lower, keyword_tokens, extracted_terms.get("found_skin_types", [])
             )
             if skin_types_targeted:
                 best_practices_score += 1
@@ -347,7 +467,7 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             # Check 3: Product type clarity
             total_checks += 1
             product_types_clear = any(
-                ptype in seo_data.get("primary_keyword", "").lower()
+                ptype in primary_keyword_lower
                 for ptype in extracted_terms.get("found_product_types", [])
             )
             if product_types_clear:
@@ -357,7 +477,7 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             
             # Check 4: Brand presence
             total_checks += 1
-            if product.brand and product.brand.lower() in seo_data.get("title", "").lower():
+            if product.brand and product.brand.lower() in title_lower:
                 best_practices_score += 1
             else:
                 recommendations.append("Include brand name in SEO title for brand awareness")
@@ -365,7 +485,7 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             # Check 5: Benefit-focused content
             total_checks += 1
             benefits_highlighted = any(
-                benefit in seo_data.get("meta_description", "").lower()
+                benefit in meta_lower
                 for benefit in extracted_terms.get("found_benefits", [])
             )
             if benefits_highlighted:
@@ -375,9 +495,8 @@ class CosmeticSEOBestPracticesTool(BaseTool):
             
             # Check 6: Local market optimization (Turkish market)
             total_checks += 1
-            turkish_optimized = any(
-                turkish_term in " ".join(seo_data.get("keywords", [])).lower()
-                for turkish_term in ["türkiye", "istanbul", "ankara", "izmir", "tr"]
+            turkish_optimized = _mentions_any(
+                keywords_lower, keyword_tokens, _TURKISH_MARKET_TERMS
             )
             if turkish_optimized:
                 best_practices_score += 1
@@ -412,20 +531,33 @@ class ValidateProductQualityTool(BaseTool):
         self.seo_quality_validation_tool = SEOQualityValidationTool()
         self.cosmetic_seo_best_practices_tool = CosmeticSEOBestPracticesTool()
     
-    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def __call__(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None,
+                       trusted: bool = False) -> Dict[str, Any]:
         """Validate product quality comprehensively"""
+        return self.validate(product_data, seo_data, extracted_terms, trusted)
+    
+    def validate(self, product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None,
+                 trusted: bool = False) -> Dict[str, Any]:
+        """Validate product quality comprehensively; pure CPU work, so it runs without an event loop"""
         try:
             if extracted_terms is None:
                 extracted_terms = {}
             
+            # Validate the models once and hand them to both sub-tools; trusted input
+            # (emitted and validated upstream by our own agents) skips field validation
+            product = ProductData.model_construct(**product_data) if trusted else ProductData(**product_data)
+            seo = _parse_seo_data(seo_data, product, trusted)
+            
             # Step 1: Technical quality validation
-            quality_result = await self.seo_quality_validation_tool(product_data, seo_data)
+            quality_result = self.seo_quality_validation_tool.validate(product_data, seo_data, product=product, seo=seo)
             
             if "error" in quality_result:
                 return quality_result
             
             # Step 2: Cosmetic industry best practices validation
-            best_practices_result = await self.cosmetic_seo_best_practices_tool(product_data, seo_data, extracted_terms)
+            best_practices_result = self.cosmetic_seo_best_practices_tool.check(
+                product_data, seo_data, extracted_terms, product=product
+            )
             
             if "error" in best_practices_result:
                 return best_practices_result
@@ -545,18 +677,70 @@ class QualityAgent(LlmAgent):
         })
 
 
+# Recent validation results keyed by an input digest; validation is pure apart from validated_at
+_VALIDATION_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_VALIDATION_CACHE_SIZE = 1024
+
+
+def _validation_key(product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any],
+                    trusted: bool = False) -> bytes:
+    """Stable digest of the validation inputs"""
+    return hashlib.blake2b(_stable_dumps([product_data, seo_data, extracted_terms, trusted]), digest_size=16).digest()
+
+
+def _validate_cached(tool: "ValidateProductQualityTool", product_data: Dict[str, Any],
+                     seo_data: Dict[str, Any], extracted_terms: Dict[str, Any],
+                     trusted: bool = False) -> Dict[str, Any]:
+    """Run one validation through the result cache"""
+    key = _validation_key(product_data, seo_data, extracted_terms, trusted)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        _VALIDATION_CACHE.move_to_end(key)
+        result = copy.deepcopy(cached)
+        result["validated_at"] = datetime.now().isoformat()
+        return result
+    
+    result = tool.validate(product_data, seo_data, extracted_terms, trusted=trusted)
+    
+    # Only complete validations are reused; errors may be transient
+    if "error" not in result:
+        _VALIDATION_CACHE[key] = copy.deepcopy(result)
+        if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+            _VALIDATION_CACHE.popitem(last=False)
+    return result
+
+
 # Direct tool function for main.py and web_app.py
-async def validate_product_quality(product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None) -> Dict[str, Any]:
+async def validate_product_quality(product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None,
+                                   trusted: bool = False) -> Dict[str, Any]:
     """Direct tool function to validate product quality"""
+    return _validate_product_quality(product_data, seo_data, extracted_terms, trusted)
+
+
+def _validate_product_quality(product_data: Dict[str, Any], seo_data: Dict[str, Any], extracted_terms: Dict[str, Any] = None,
+                              trusted: bool = False) -> Dict[str, Any]:
+    """Synchronous core of validate_product_quality"""
     try:
-        tool = ValidateProductQualityTool()
-        result = await tool(product_data, seo_data, extracted_terms or {})
-        return result
+        return _validate_cached(ValidateProductQualityTool(), product_data, seo_data, extracted_terms or {}, trusted)
     except Exception as e:
         logger.error(f"Direct validate_product_quality error: {e}")
         return {"error": str(e)}
 
 
+def validate_products_batch(items: List[Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """Validate many (product_data, seo_data, extracted_terms) triples with one shared tool set; blocking, CPU-bound"""
+    tool = ValidateProductQualityTool()
+    results = []
+    for product_data, seo_data, extracted_terms in items:
+        try:
+            results.append(_validate_cached(tool, product_data, seo_data, extracted_terms or {}))
+        except Exception as e:
+            # One bad item must not sink the rest of the batch
+            logger.error(f"Batch validate_product_quality error: {e}")
+            results.append({"error": str(e)})
+    return results
+
+
 # Agent factory function for ADK orchestration
 def create_quality_agent() -> QualityAgent:
     """Factory function to create Quality Agent instance"""
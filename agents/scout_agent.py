@@ -5,10 +5,25 @@ Discovers cosmetic product URLs from e-commerce websites using base classes
 
 import asyncio
 import aiohttp
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import cycle
+import hashlib
+import json
+import logging
+import sqlite3
 import ssl
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
-import random
+import time
+from pathlib import Path
+from types import MappingProxyType
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Dict, Any, Iterator, Mapping, Optional, Tuple
+import re
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
 
 from google.adk.agents import Agent
 from config.models import SiteConfig, ProductData, AgentTask
@@ -17,16 +32,378 @@ from config.sites import SITE_CONFIGS
 from .utils import BaseAgent, error_handler, RetryMixin
 from .base_tool import BaseTool, tool_error_handler
 from .constants import (
-    USER_AGENTS, DEFAULT_TIMEOUTS, DELAY_RANGES, COMMON_SELECTORS, 
+    USER_AGENTS, DEFAULT_TIMEOUTS, COMMON_SELECTORS, 
     ERROR_MESSAGES, SUCCESS_MESSAGES, PRODUCT_URL_PATTERNS
 )
 from .utils import URLUtils, TextCleaner
 from .config import config
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator
+    _CSS_TRANSLATOR = HTMLTranslator()
+except ImportError:
+    _CSS_TRANSLATOR = None
+
+logger = logging.getLogger(__name__)
+
+# Default headers of the discovery session; aiohttp itself advertises gzip/deflate, and br when Brotli is installed
+_SESSION_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7"
+}
+
+# Sitemap discovery: entry point, cap on sitemap files per run, and hints that mark product sitemaps
+_SITEMAP_PATH = "/sitemap.xml"
+_MAX_SITEMAP_FILES = 20
+_PRODUCT_SITEMAP_HINTS = ("product", "urun")
+
+# Upper bound on the threads parsing category pages
+_MAX_PARSE_WORKERS = 4
+
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _compile_url_patterns(patterns: List[str]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """Split URL patterns into plain substrings and one compiled alternation of the rest."""
+    literals, regexes = [], []
+    for pattern in patterns:
+        # A trailing .* adds nothing to re.search, and without it many patterns are plain substrings
+        core = pattern[:-2] if pattern.endswith('.*') and not pattern.endswith('\\.*') else pattern
+        if _REGEX_METACHARS.isdisjoint(core):
+            literals.append(core)
+        else:
+            regexes.append(pattern)
+    combined = re.compile('|'.join(f'(?:{pattern})' for pattern in regexes)) if regexes else None
+    return tuple(dict.fromkeys(literals)), combined
+
+
+# Per-site product URL matchers: substring checks first, then a single regex search
+_PRODUCT_URL_MATCHERS = {
+    site: _compile_url_patterns(patterns)
+    for site, patterns in PRODUCT_URL_PATTERNS.items()
+    if patterns
+}
+
+
+def _is_product_sitemap(sitemap_url: str) -> bool:
+    """Whether a sitemap URL names a product sitemap (sitemap_products.xml, urun-sitemap.xml)."""
+    lowered = sitemap_url.lower()
+    return any(hint in lowered for hint in _PRODUCT_SITEMAP_HINTS)
+
+
+def _has_specific_url_patterns(site_name: str) -> bool:
+    """Whether a site's product URL patterns reject anything (i.e. are not just '/.*')."""
+    matcher = _PRODUCT_URL_MATCHERS.get(site_name)
+    if matcher is None:
+        return False
+    literals, _ = matcher
+    return '' not in literals and '/' not in literals
+
+
+# Selectors that only inspect the <a> element itself (a[href*='/p/'], a.product-link), never its ancestors
+_ANCHOR_ONLY_SELECTOR_RE = re.compile(r'^a(?:\.[\w-]+|\[[^\]]*\])*$')
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+# CSS selector -> compiled XPath returning the matched elements' href values
+_HREF_XPATHS: Dict[str, Any] = {}
+
+
+def _href_xpath(selector: str):
+    """Translate a CSS selector to XPath once and keep the compiled expression."""
+    xpath = _HREF_XPATHS.get(selector)
+    if xpath is None:
+        xpath = etree.XPath(f"({_CSS_TRANSLATOR.css_to_xpath(selector)})/@href")
+        _HREF_XPATHS[selector] = xpath
+    return xpath
+
+
+def _parse_category_html(html_content: str, selectors: Optional[List[str]] = None):
+    """Parse category HTML with selectolax, then lxml, falling back to BeautifulSoup (or when SCOUT_USE_BS4 is set)."""
+    if not config.env.scout_use_bs4:
+        if HTMLParser is not None:
+            return HTMLParser(html_content)
+        if _CSS_TRANSLATOR is not None:
+            try:
+                return lxml.html.fromstring(html_content)
+            except (etree.ParserError, ValueError):
+                # Empty documents, or str input carrying an XML encoding declaration
+                pass
+    # Anchor-only selectors can run against a tree that holds nothing but the page's links
+    if selectors and all(_ANCHOR_ONLY_SELECTOR_RE.match(selector.strip()) for selector in selectors):
+        return BeautifulSoup(html_content, 'lxml', parse_only=_ANCHOR_STRAINER)
+    return BeautifulSoup(html_content, 'lxml')
+
+
+def _select_hrefs(tree, selector: str) -> List[Optional[str]]:
+    """href attributes of the nodes matching selector in either parse tree."""
+    if isinstance(tree, BeautifulSoup):
+        return [link.get('href') for link in tree.select(selector)]
+    if _CSS_TRANSLATOR is not None and isinstance(tree, lxml.html.HtmlElement):
+        return [str(href) for href in _href_xpath(selector)(tree)]
+    return [node.attributes.get('href') for node in tree.css(selector)]
+
+
+def _is_product_url(url: str, site_name: str) -> bool:
+    """Validate if URL is a valid product URL."""
+    if not URLUtils.is_valid_url(url):
+        return False
+    
+    matcher = _PRODUCT_URL_MATCHERS.get(site_name)
+    if matcher is None:
+        return True
+    
+    literals, pattern = matcher
+    if any(literal in url for literal in literals):
+        return True
+    return pattern is not None and pattern.search(url) is not None
+
+
+def _extract_links(tree, selectors: List[str], base_url: str, site_name: str) -> List[str]:
+    """Product links of the first selector that matches any, in document order without duplicates."""
+    product_urls = []
+    seen = set()
+    
+    # Navigation and product hrefs repeat across pages, so the cached builder mostly hits
+    absolute = partial(URLUtils.build_absolute_url, base_url=base_url)
+    
+    for selector in selectors:
+        try:
+            matched = False
+            for href in _select_hrefs(tree, selector):
+                if href:
+                    # Build absolute URL
+                    absolute_url = absolute(href)
+                    
+                    # Validate product URL
+                    if _is_product_url(absolute_url, site_name):
+                        matched = True
+                        if absolute_url not in seen:
+                            seen.add(absolute_url)
+                            product_urls.append(absolute_url)
+            
+            if matched:
+                break
+                
+        except Exception as e:
+            logger.debug(f"Selector '{selector}' failed: {e}")
+            continue
+    
+    return product_urls
+
+
+def _parse_links_worker(html_content: str, selectors: List[str], base_url: str, site_name: str) -> List[str]:
+    """Parse a category page and extract its product links; runs on the parse threads."""
+    return _extract_links(_parse_category_html(html_content, selectors), selectors, base_url, site_name)
+
+
+def _extraction_fingerprint(site_config: SiteConfig, selectors: List[str]) -> str:
+    """Digest of everything that decides a page's extracted links: base URL, selectors and URL patterns."""
+    payload = json.dumps([site_config.base_url, selectors, PRODUCT_URL_PATTERNS.get(site_config.name, [])])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class _PageCache:
+    """SQLite store of category page validators (ETag / Last-Modified) and the product links extracted from them."""
+    
+    def __init__(self, db_path: Path, max_age: float = 24 * 3600):
+        self.db_path = db_path
+        self.max_age = max_age
+        self._conn: Optional[sqlite3.Connection] = None
+        # A single thread owns the connection, so sqlite3 never blocks the event loop or crosses threads
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="category-page-cache")
+    
+    def _connection(self) -> sqlite3.Connection:
+        """The cache connection, opened (and the table created) on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS category_page_links (
+                        url TEXT PRIMARY KEY,
+                        fingerprint TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        links TEXT NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )
+                """)
+            self._conn = conn
+        return self._conn
+    
+    def _lookup(self, url: str, fingerprint: str) -> Optional[Tuple[Optional[str], Optional[str], List[str]]]:
+        """Blocking lookup; runs on the cache thread."""
+        try:
+            row = self._connection().execute(
+                "SELECT etag, last_modified, links FROM category_page_links "
+                "WHERE url = ? AND fingerprint = ? AND fetched_at >= ?",
+                (url, fingerprint, time.time() - self.max_age)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Category page cache lookup failed: {e}")
+            return None
+        
+        if row is None:
+            return None
+        etag, last_modified, links = row
+        return etag, last_modified, json.loads(links)
+    
+    def _store(self, url: str, fingerprint: str, etag: Optional[str], last_modified: Optional[str],
+               links: List[str]) -> None:
+        """Blocking store; runs on the cache thread."""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO category_page_links "
+                    "(url, fingerprint, etag, last_modified, links, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, fingerprint, etag, last_modified, json.dumps(links), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Category page cache store failed: {e}")
+    
+    def _close(self) -> None:
+        """Blocking close; runs on the cache thread."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+    
+    async def lookup(self, url: str, fingerprint: str) -> Optional[Tuple[Optional[str], Optional[str], List[str]]]:
+        """Validators and links stored for url under the same extraction fingerprint, unless older than max_age."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._lookup, url, fingerprint)
+    
+    async def store(self, url: str, fingerprint: str, etag: Optional[str], last_modified: Optional[str],
+                    links: List[str]) -> None:
+        """Remember the validators and extracted links of a freshly downloaded page."""
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._store, url, fingerprint, etag, last_modified, links
+        )
+    
+    async def close(self) -> None:
+        """Close the cache connection and stop its thread."""
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+class _TokenBucket:
+    """Paces requests to one host at `rate` per second, allowing bursts of up to `capacity`."""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1
+                self._updated = loop.time()
+            self._tokens -= 1
+
 
 class ProductURLDiscoveryTool(BaseTool):
     """Tool for discovering product URLs from e-commerce sites."""
     
+    # One keep-alive pool shared by every instance; rebuilt when used from a new event loop
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Rate limiters per host, living as long as the session's loop
+    _host_buckets: Dict[str, _TokenBucket] = {}
+    # Rotating, precomputed request headers per site
+    _header_cycles: Dict[str, Iterator[Mapping[str, str]]] = {}
+    # Threads that parse category HTML off the event loop
+    _parse_pool: Optional[ThreadPoolExecutor] = None
+    # Category page validators and links, opened on first use
+    _page_cache: Optional[_PageCache] = None
+    
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                keepalive_timeout=85,
+                ttl_dns_cache=300,
+                ssl=ssl_context
+            )
+            cls._session = aiohttp.ClientSession(connector=connector, headers=_SESSION_HEADERS)
+            if cls._session_loop is not loop:
+                cls._host_buckets = {}
+            cls._session_loop = loop
+        return cls._session
+    
+    @classmethod
+    def _host_bucket(cls, url: str, site_config: SiteConfig) -> _TokenBucket:
+        """Rate limiter for the host of url, sized from the site's requests_per_minute."""
+        host = URLUtils.extract_domain(url)
+        bucket = cls._host_buckets.get(host)
+        if bucket is None:
+            bucket = _TokenBucket(
+                rate=site_config.requests_per_minute / 60,
+                capacity=site_config.concurrent_requests
+            )
+            cls._host_buckets[host] = bucket
+        return bucket
+    
+    @classmethod
+    def _get_parse_pool(cls) -> ThreadPoolExecutor:
+        """Return the shared parse pool, starting it on first use."""
+        if cls._parse_pool is None:
+            # Threads, not processes: the HTML is not pickled per page and nothing forks next to the cache thread
+            cls._parse_pool = ThreadPoolExecutor(
+                max_workers=min(_MAX_PARSE_WORKERS, os.cpu_count() or 1),
+                thread_name_prefix="category-parse"
+            )
+        return cls._parse_pool
+    
+    @classmethod
+    def _get_page_cache(cls) -> _PageCache:
+        """Return the category page cache, creating it on first use."""
+        if cls._page_cache is None:
+            cls._page_cache = _PageCache(Path(config.files.cache_dir) / "category_pages.db")
+        return cls._page_cache
+    
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP session, parse pool and page cache connection."""
+        session, cls._session = cls._session, None
+        if session is not None and not session.closed:
+            await session.close()
+        
+        pool, cls._parse_pool = cls._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        
+        cache, cls._page_cache = cls._page_cache, None
+        if cache is not None:
+            await cache.close()
+    
     def get_schema(self) -> Dict[str, Any]:
         """Get tool schema for ADK registration."""
         return {
@@ -75,105 +452,292 @@ class ProductURLDiscoveryTool(BaseTool):
     async def execute(self, site_name: str, max_products: int = 100, category: str = "", **kwargs) -> Dict[str, Any]:
         """Execute URL discovery."""
         site_config = config.sites[site_name]
+        session = self._get_session()
         
-        # Create SSL context
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        discovered_urls = []
+        # URLs already collected by any category or page of this run
+        seen = set()
         
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        # Get category paths to crawl
+        category_paths = site_config.category_paths if hasattr(site_config, 'category_paths') else ['/']
+        if category:
+            category_paths = [path for path in category_paths if category.lower() in path.lower()]
         
-        async with aiohttp.ClientSession(connector=connector) as session:
-            discovered_urls = []
-            
-            # Get category paths to crawl
-            category_paths = site_config.category_paths if hasattr(site_config, 'category_paths') else ['/']
-            if category:
-                category_paths = [path for path in category_paths if category.lower() in path.lower()]
+        if category_paths:
+            # Crawl every category concurrently; the shared semaphore caps in-flight requests to the host
+            semaphore = asyncio.Semaphore(site_config.concurrent_requests)
+            results = await asyncio.gather(
+                *[
+                    self._crawl_category(
+                        session,
+                        category_path,
+                        site_config,
+                        max_products // len(category_paths),
+                        semaphore=semaphore,
+                        seen=seen
+                    )
+                    for category_path in category_paths
+                ],
+                return_exceptions=True
+            )
             
-            for category_path in category_paths:
-                urls = await self._crawl_category(
-                    session, 
-                    category_path, 
-                    site_config, 
-                    max_products // len(category_paths)
-                )
+            for category_path, urls in zip(category_paths, results):
+                if isinstance(urls, Exception):
+                    self.logger.error(f"Error crawling {category_path}: {urls}")
+                    continue
                 discovered_urls.extend(urls)
-                
-                if len(discovered_urls) >= max_products:
-                    break
-                
-                # Rate limiting
-                await asyncio.sleep(random.uniform(*DELAY_RANGES["between_pages"]))
-            
-            return self.format_success_result(
-                data={
-                    "site_name": site_name,
-                    "discovered_urls": discovered_urls[:max_products],
-                    "total_count": len(discovered_urls[:max_products]),
-                    "categories_searched": len(category_paths)
-                },
-                message=SUCCESS_MESSAGES["products_found"].format(count=len(discovered_urls[:max_products]))
-            )
+        
+        # A marketplace sitemap is not limited to cosmetics, so it only tops up a short category crawl
+        sitemap_count = 0
+        remaining = max_products - len(discovered_urls)
+        if not category and remaining > 0:
+            sitemap_urls = await self._discover_via_sitemap(session, site_config, remaining, seen)
+            sitemap_count = min(len(sitemap_urls), remaining)
+            discovered_urls.extend(sitemap_urls)
+        
+        trimmed = discovered_urls[:max_products]
+        count = len(trimmed)
+        return self.format_success_result(
+            data={
+                "site_name": site_name,
+                "discovered_urls": trimmed,
+                "total_count": count,
+                "sitemap_count": sitemap_count,
+                "categories_searched": len(category_paths)
+            },
+            message=SUCCESS_MESSAGES["products_found"].format(count=count)
+        )
     
     async def _crawl_category(
         self, 
         session: aiohttp.ClientSession,
         category_path: str,
         site_config: SiteConfig,
-        max_urls: int
+        max_urls: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        seen: Optional[set] = None
     ) -> List[str]:
         """Crawl a category page to discover product URLs."""
         product_urls = []
-        page = 1
+        if seen is None:
+            seen = set()
         max_pages = getattr(site_config, 'max_pages', 5)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(site_config.concurrent_requests)
         
-        while page <= max_pages and len(product_urls) < max_urls:
-            try:
-                url = URLUtils.build_absolute_url(category_path, site_config.base_url)
-                
-                # Add pagination
-                if page > 1:
-                    url = self._add_pagination(url, page, site_config.name)
-                
-                # Make request
-                headers = {"User-Agent": random.choice(USER_AGENTS)}
-                if site_config.custom_headers:
-                    headers.update(site_config.custom_headers)
+        # Pagination URLs are deterministic, so a small window of pages is kept in flight and the
+        # next page is scheduled as soon as one completes; the host bucket paces the requests
+        category_url = URLUtils.build_absolute_url(category_path, site_config.base_url)
+        window = max(1, site_config.concurrent_requests)
+        pending = {}
+        next_page = 1
+        last_page = max_pages
+        
+        try:
+            while len(product_urls) < max_urls:
+                while next_page <= last_page and len(pending) < window:
+                    url = category_url if next_page == 1 else self._add_pagination(category_url, next_page, site_config.name)
+                    task = asyncio.ensure_future(
+                        self._fetch_page_links(session, url, next_page, site_config, semaphore, seen)
+                    )
+                    pending[task] = next_page
+                    next_page += 1
+                if not pending:
+                    break
                 
-                async with session.get(
-                    url, 
-                    headers=headers,
-                    timeout=DEFAULT_TIMEOUTS["request"]
-                ) as response:
-                    if response.status != 200:
-                        self.logger.warning(f"HTTP {response.status} for {url}")
-                        break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = pending.pop(task)
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        self.logger.error(f"Error crawling page {page} of {category_path}: {task.exception()}")
+                        continue
                     
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'html.parser')
-                    
-                    # Extract product links
-                    page_urls = self._extract_product_links(soup, site_config)
-                    
-                    if not page_urls:
+                    page_links, page_urls = task.result()
+                    if not page_links:
+                        # Pagination ran out (no product links at all, before dedup); stop at this page
                         self.logger.info(f"No more products found on page {page}")
-                        break
+                        last_page = min(last_page, page - 1)
+                        for other, other_page in list(pending.items()):
+                            if other_page > page:
+                                other.cancel()
+                                del pending[other]
+                        continue
                     
                     product_urls.extend(page_urls)
-                    self.logger.info(f"Found {len(page_urls)} URLs on page {page}")
-                    
-                    page += 1
-                    
-                    # Rate limiting
-                    await asyncio.sleep(random.uniform(*DELAY_RANGES["request"]))
-                    
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return product_urls
+    
+    async def _fetch_page_links(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        page: int,
+        site_config: SiteConfig,
+        semaphore: asyncio.Semaphore,
+        seen: set
+    ) -> Tuple[List[str], List[str]]:
+        """Fetch one category page; returns all its product links and the ones not in seen yet."""
+        headers = self._request_headers(site_config)
+        
+        # Revalidate a recent copy instead of downloading and parsing the page again; links cached
+        # under other selectors or URL patterns do not count
+        fingerprint = _extraction_fingerprint(site_config, self._product_link_selectors(site_config))
+        cached = await self._get_page_cache().lookup(url, fingerprint)
+        if cached is not None:
+            etag, last_modified, cached_links = cached
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        bucket = self._host_bucket(url, site_config)
+        async with semaphore:
+            # Rate limiting
+            await bucket.acquire()
+            
+            async with session.get(
+                url, 
+                headers=headers,
+                timeout=DEFAULT_TIMEOUTS["request"]
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    html_content = None
+                elif response.status != 200:
+                    self.logger.warning(f"HTTP {response.status} for {url}")
+                    return [], []
+                else:
+                    html_content = await response.text()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+        
+        if html_content is None:
+            page_links = cached_links
+        else:
+            # Extract product links
+            page_links = await self._parse_links(html_content, site_config)
+            if etag or last_modified:
+                await self._get_page_cache().store(url, fingerprint, etag, last_modified, page_links)
+        
+        page_urls = [link for link in page_links if link not in seen]
+        seen.update(page_urls)
+        if page_urls:
+            self.logger.info(f"Found {len(page_urls)} URLs on page {page}")
+        return page_links, page_urls
+    
+    async def _parse_links(self, html_content: str, site_config: SiteConfig) -> List[str]:
+        """Parse a page and extract its product links in the parse pool, so the event loop keeps downloading."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_parse_pool(),
+            _parse_links_worker,
+            html_content,
+            self._product_link_selectors(site_config),
+            site_config.base_url,
+            site_config.name
+        )
+    
+    async def _discover_via_sitemap(
+        self,
+        session: aiohttp.ClientSession,
+        site_config: SiteConfig,
+        max_urls: int,
+        seen: set
+    ) -> List[str]:
+        """Collect product URLs from the site's sitemap, following sitemap indexes."""
+        product_urls = []
+        queue = deque([URLUtils.build_absolute_url(_SITEMAP_PATH, site_config.base_url)])
+        fetched = 0
+        
+        while queue and fetched < _MAX_SITEMAP_FILES and len(product_urls) < max_urls:
+            sitemap_url = queue.popleft()
+            fetched += 1
+            try:
+                child_sitemaps = await self._read_sitemap(
+                    session, sitemap_url, site_config, max_urls, seen, product_urls
+                )
             except Exception as e:
-                self.logger.error(f"Error crawling page {page} of {category_path}: {e}")
-                break
+                self.logger.debug(f"Sitemap {sitemap_url} unavailable: {e}")
+                continue
+            
+            # Follow product sitemaps of an index; fall back to all of them when none is marked as such
+            product_children = [loc for loc in child_sitemaps if _is_product_sitemap(loc)]
+            queue.extend(product_children or child_sitemaps)
         
+        if product_urls:
+            self.logger.info(f"Found {len(product_urls)} URLs in the sitemap of {site_config.name}")
         return product_urls
     
+    async def _read_sitemap(
+        self,
+        session: aiohttp.ClientSession,
+        sitemap_url: str,
+        site_config: SiteConfig,
+        max_urls: int,
+        seen: set,
+        product_urls: List[str]
+    ) -> List[str]:
+        """Stream one sitemap into product_urls and return the nested sitemap URLs it lists."""
+        child_sitemaps = []
+        # Catch-all URL patterns cannot tell products from other pages, so only product sitemaps count then
+        accept_urls = _is_product_sitemap(sitemap_url) or _has_specific_url_patterns(site_config.name)
+        parser = ET.XMLPullParser(events=('end',))
+        inflater = None
+        first_chunk = True
+        
+        await self._host_bucket(sitemap_url, site_config).acquire()
+        async with session.get(
+            sitemap_url,
+            headers=self._request_headers(site_config),
+            timeout=DEFAULT_TIMEOUTS["request"]
+        ) as response:
+            if response.status != 200:
+                return child_sitemaps
+            
+            async for chunk in response.content.iter_chunked(65536):
+                # .xml.gz files arrive as gzip payloads, not as a Content-Encoding aiohttp would undo
+                if first_chunk:
+                    first_chunk = False
+                    if chunk[:2] == b'\x1f\x8b':
+                        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                parser.feed(inflater.decompress(chunk) if inflater is not None else chunk)
+                
+                for _, element in parser.read_events():
+                    tag = element.tag.rpartition('}')[2]
+                    if tag == 'url':
+                        loc = (element.findtext('{*}loc') or '').strip()
+                        if accept_urls and loc and loc not in seen and self._is_valid_product_url(loc, site_config.name):
+                            seen.add(loc)
+                            product_urls.append(loc)
+                        element.clear()
+                    elif tag == 'sitemap':
+                        loc = (element.findtext('{*}loc') or '').strip()
+                        if loc:
+                            child_sitemaps.append(loc)
+                        element.clear()
+                
+                if len(product_urls) >= max_urls:
+                    break
+        
+        return child_sitemaps
+    
+    @classmethod
+    def _request_headers(cls, site_config: SiteConfig) -> Mapping[str, str]:
+        """Per-request headers: the next User-Agent in rotation plus the site's custom headers (read-only)."""
+        variants = cls._header_cycles.get(site_config.name)
+        if variants is None:
+            # Merged once per site and User-Agent instead of rebuilding the dict on every request
+            variants = cycle([
+                MappingProxyType({"User-Agent": user_agent, **(site_config.custom_headers or {})})
+                for user_agent in USER_AGENTS
+            ])
+            cls._header_cycles[site_config.name] = variants
+        return next(variants)
+    
     def _add_pagination(self, url: str, page: int, site_name: str) -> str:
         """Add pagination parameters to URL."""
         if site_name == "trendyol":
@@ -189,53 +753,33 @@ class ProductURLDiscoveryTool(BaseTool):
             separator = "&" if "?" in url else "?"
             return f"{url}{separator}p={page}"
     
-    def _extract_product_links(self, soup: BeautifulSoup, site_config: SiteConfig) -> List[str]:
+    def _extract_product_links(self, tree, site_config: SiteConfig) -> List[str]:
         """Extract product links from page HTML."""
-        product_urls = []
-        
-        # Try site-specific selectors first
+        return _extract_links(tree, self._product_link_selectors(site_config), site_config.base_url, site_config.name)
+    
+    def _product_link_selectors(self, site_config: SiteConfig) -> List[str]:
+        """Product link selectors for a site, site-specific ones first."""
         selectors = site_config.selectors.get("product_links", COMMON_SELECTORS["product_links"])
         if isinstance(selectors, str):
             selectors = [selectors]
-        
-        for selector in selectors:
-            try:
-                links = soup.select(selector)
-                
-                for link in links:
-                    href = link.get('href')
-                    if href:
-                        # Build absolute URL
-                        absolute_url = URLUtils.build_absolute_url(href, site_config.base_url)
-                        
-                        # Validate product URL
-                        if self._is_valid_product_url(absolute_url, site_config.name):
-                            product_urls.append(absolute_url)
-                
-                if product_urls:
-                    break
-                    
-            except Exception as e:
-                self.logger.debug(f"Selector '{selector}' failed: {e}")
-                continue
-        
-        return list(set(product_urls))  # Remove duplicates
+        return selectors
     
     def _is_valid_product_url(self, url: str, site_name: str) -> bool:
         """Validate if URL is a valid product URL."""
-        if not URLUtils.is_valid_url(url):
-            return False
-        
-        patterns = PRODUCT_URL_PATTERNS.get(site_name, [])
-        if not patterns:
-            return True
-        
-        import re
-        for pattern in patterns:
-            if re.search(pattern, url):
-                return True
-        
-        return False
+        return _is_product_url(url, site_name)
+
+def _close_session_at_exit() -> None:
+    """Best-effort close of the shared discovery session when its loop is still usable."""
+    loop = ProductURLDiscoveryTool._session_loop
+    if ProductURLDiscoveryTool._session is None or loop is None or loop.is_closed() or loop.is_running():
+        return
+    try:
+        loop.run_until_complete(ProductURLDiscoveryTool.close())
+    except Exception as e:
+        logger.debug(f"Discovery session shutdown failed: {e}")
+
+
+atexit.register(_close_session_at_exit)
 
 
 class ScoutAgent(BaseAgent, RetryMixin):
@@ -299,6 +843,10 @@ class ScoutAgent(BaseAgent, RetryMixin):
         )
         
         return result
+    
+    async def close(self) -> None:
+        """Release the shared HTTP session used for discovery."""
+        await ProductURLDiscoveryTool.close()
 
 
 # Direct tool function for backward compatibility
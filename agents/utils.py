@@ -16,7 +16,7 @@ import logging
 import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
@@ -256,6 +256,7 @@ class URLUtils:
     """Utility class for URL operations."""
     
     @staticmethod
+    @lru_cache(maxsize=1 << 16)
     def is_valid_url(url: str) -> bool:
         """Validate URL format."""
         try:
@@ -265,6 +266,7 @@ class URLUtils:
             return False
     
     @staticmethod
+    @lru_cache(maxsize=1 << 16)
     def build_absolute_url(url: str, base_url: str) -> str:
         """Build absolute URL from relative URL."""
         if not url: